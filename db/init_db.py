@@ -6,14 +6,15 @@ Usage:
     python db/init_db.py
 """
 
+import functools
 import logging
 import os
-import re
+from typing import Iterator
 
 import oracledb
 from dotenv import load_dotenv
 
-from analytics.path_config import DB_DIR
+from analytics.path_config import SCHEMA_FILE
 
 # Load environment variables
 load_dotenv()
@@ -36,10 +37,104 @@ ORACLE_SID = os.getenv("ORACLE_SID", "XEPDB1")
 NEW_ORACLE_USER = os.getenv("NEW_ORACLE_USER", "myappuser")
 NEW_ORACLE_PASSWORD = os.getenv("NEW_ORACLE_PASSWORD", "securepass123")
 
-SCHEMA_FILE = os.path.join(DB_DIR, "schema.sql")
 
-# DSN string for connections
-dsn = oracledb.makedsn(ORACLE_HOST, ORACLE_PORT, service_name=ORACLE_SID)
+@functools.cache
+def get_dsn() -> str:
+    """DSN string for connections, built on first use rather than at import."""
+    return oracledb.makedsn(ORACLE_HOST, ORACLE_PORT, service_name=ORACLE_SID)
+
+
+# Statements starting with these run until a line holding only "/"
+_PLSQL_PREFIXES = ("CREATE OR REPLACE TRIGGER", "BEGIN", "DECLARE")
+_PLSQL_PREFIX_LEN = max(len(prefix) for prefix in _PLSQL_PREFIXES)
+
+# Lexical scanner states for split_statements
+_NORMAL, _SQ_STRING, _LINE_COMMENT_STATE, _BLOCK_COMMENT_STATE = range(4)
+
+
+def _emit(statement: str) -> Iterator[str]:
+    """Yield the stripped statement unless it is blank."""
+    statement = statement.strip()
+    if statement:
+        yield statement
+
+
+def split_statements(script: str) -> Iterator[str]:
+    """
+    Split a SQL script into executable statements in a single pass.
+
+    Plain statements end at `;` (excluded); PL/SQL blocks end at a line
+    containing only `/` (excluded). `--` and `/* */` comments are dropped
+    from the statements. Quoted strings are kept verbatim, so terminators
+    and comment markers inside them are ignored.
+    """
+    n = len(script)
+    state = _NORMAL
+    # Text of the current statement is pieces + script[seg_start:]; each
+    # comment closes one piece and starts the next after it
+    pieces = []
+    seg_start = 0
+    line_start = 0
+    at_stmt_start = True
+    in_plsql = False
+
+    i = 0
+    while i < n:
+        c = script[i]
+        if state == _SQ_STRING:
+            if c == "'":
+                state = _NORMAL
+        elif state == _LINE_COMMENT_STATE:
+            if c == "\n":
+                state = _NORMAL
+                seg_start = i  # keep the newline
+        elif state == _BLOCK_COMMENT_STATE:
+            if c == "*" and script.startswith("/", i + 1):
+                state = _NORMAL
+                i += 1
+                pieces.append(" ")  # a comment separates tokens
+                seg_start = i + 1
+        elif c == "-" and script.startswith("-", i + 1):
+            state = _LINE_COMMENT_STATE
+            pieces.append(script[seg_start:i])
+            i += 1
+        elif c == "/" and script.startswith("*", i + 1):
+            state = _BLOCK_COMMENT_STATE
+            pieces.append(script[seg_start:i])
+            i += 1
+        else:
+            if at_stmt_start and not c.isspace():
+                at_stmt_start = False
+                head = script[i : i + _PLSQL_PREFIX_LEN].upper()
+                in_plsql = head.startswith(_PLSQL_PREFIXES)
+
+            if c == "'":
+                state = _SQ_STRING
+            elif c == ";" and not in_plsql:
+                yield from _emit("".join(pieces) + script[seg_start:i])
+                pieces = []
+                seg_start = i + 1
+                at_stmt_start = True
+            elif c == "/" and in_plsql and not script[line_start:i].strip():
+                eol = script.find("\n", i)
+                if eol == -1:
+                    eol = n
+                if not script[i + 1 : eol].strip():
+                    yield from _emit("".join(pieces) + script[seg_start:line_start])
+                    pieces = []
+                    seg_start = eol
+                    at_stmt_start = True
+                    in_plsql = False
+                    i = eol
+                    continue
+
+        if c == "\n":
+            line_start = i + 1
+        i += 1
+
+    if state in (_LINE_COMMENT_STATE, _BLOCK_COMMENT_STATE):
+        seg_start = n  # unterminated comment at the end of the script
+    yield from _emit("".join(pieces) + script[seg_start:])
 
 
 def create_user_if_not_exists(cursor, username: str, password: str):
@@ -78,49 +173,7 @@ def execute_schema(cursor, filepath: str) -> None:
         with open(filepath, "r", encoding="utf-8") as file:
             raw_sql = file.read()
 
-        def remove_sql_comments(sql: str) -> str:
-            sql = re.sub(r"--.*?(\r\n|\r|\n)", "\n", sql)
-            sql = re.sub(r"/\*.*?\*/", "", sql, flags=re.DOTALL)
-            return sql
-
-        def split_statements(script: str) -> list:
-            statements = []
-            buffer = []
-
-            lines = script.splitlines()
-            inside_plsql = False
-
-            for line in lines:
-                stripped = line.strip()
-
-                if not inside_plsql and stripped.upper().startswith(
-                    "CREATE OR REPLACE TRIGGER"
-                ):
-                    inside_plsql = True
-
-                if inside_plsql:
-                    buffer.append(line)
-                    if stripped == "/":  # End of PL/SQL block
-                        statements.append("\n".join(buffer[:-1]).strip())  # Exclude '/'
-                        buffer = []
-                        inside_plsql = False
-                else:
-                    if stripped.endswith(";"):
-                        buffer.append(line)
-                        statements.append("\n".join(buffer).strip().rstrip(";"))
-                        buffer = []
-                    else:
-                        buffer.append(line)
-
-            # Remaining buffer
-            if buffer:
-                statements.append("\n".join(buffer).strip().rstrip(";"))
-
-            return [
-                remove_sql_comments(stmt).strip() for stmt in statements if stmt.strip()
-            ]
-
-        statements = split_statements(raw_sql)
+        statements = list(split_statements(raw_sql))
 
         logging.info(f"Executing {len(statements)} SQL statements...")
 
@@ -160,7 +213,7 @@ def main():
     logging.info(f"Connecting as admin user '{ORACLE_ADMIN_USER}' to create user...")
     try:
         with oracledb.connect(
-            user=ORACLE_ADMIN_USER, password=ORACLE_ADMIN_PASSWORD, dsn=dsn
+            user=ORACLE_ADMIN_USER, password=ORACLE_ADMIN_PASSWORD, dsn=get_dsn()
         ) as admin_conn:
             with admin_conn.cursor() as cursor:
                 create_user_if_not_exists(cursor, NEW_ORACLE_USER, NEW_ORACLE_PASSWORD)
@@ -173,14 +226,14 @@ def main():
     logging.info(f"Connecting as new user '{NEW_ORACLE_USER}' to initialize schema...")
     try:
         with oracledb.connect(
-            user=NEW_ORACLE_USER, password=NEW_ORACLE_PASSWORD, dsn=dsn
+            user=NEW_ORACLE_USER, password=NEW_ORACLE_PASSWORD, dsn=get_dsn()
         ) as user_conn:
             with user_conn.cursor() as cursor:
                 cursor.execute("SELECT user FROM dual")
                 current_user = cursor.fetchone()[0]
                 logging.info(f"Connected as Oracle user: {current_user}")
 
-                execute_schema(cursor, SCHEMA_FILE)
+                execute_schema(cursor, str(SCHEMA_FILE))
                 user_conn.commit()
                 logging.info("✅ Database schema initialized successfully.")
 
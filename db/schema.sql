@@ -39,3 +39,16 @@ BEGIN
     SELECT REVIEWS_SEQ.NEXTVAL INTO :NEW.ID FROM DUAL;
 END;
 /
+
+CREATE GLOBAL TEMPORARY TABLE REVIEWS_STAGE (
+    REVIEW_TEXT CLOB,
+    RATING NUMBER(2,1),
+    REVIEW_DATE DATE,
+    BANK_NAME VARCHAR2(255),
+    SOURCE VARCHAR2(100),
+    CLEANED_TEXT CLOB,
+    SENTIMENT_LABEL VARCHAR2(20),
+    SENTIMENT_SCORE FLOAT,
+    KEYWORDS CLOB,
+    THEMES CLOB
+) ON COMMIT DELETE ROWS;
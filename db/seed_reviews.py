@@ -7,11 +7,15 @@ Usage:
     python db/seed_reviews.py [optional_csv_path]
 """
 
+import ast
 import csv
+import functools
 import json
 import logging
 import os
 import sys
+from datetime import date
+from typing import Iterator, List, Tuple
 
 import oracledb
 from dotenv import load_dotenv
@@ -39,20 +43,147 @@ ORACLE_SID = os.getenv("ORACLE_SID", "XEPDB1")
 
 DSN = oracledb.makedsn(ORACLE_HOST, ORACLE_PORT, service_name=ORACLE_SID)
 
+# Idempotent bank insert: existing names are left untouched
+MERGE_BANK_SQL = (
+    "MERGE INTO BANKS b"
+    " USING (SELECT :1 AS name FROM dual) s"
+    " ON (b.NAME = s.name)"
+    " WHEN NOT MATCHED THEN INSERT (NAME) VALUES (s.name)"
+)
+
+# Rows sent to Oracle per executemany() round-trip
+BATCH_SIZE = 1000
+
+# Prepared statements kept per connection; the SQL below are module constants
+# so every batch hits the same cache entry and skips the soft parse
+STATEMENT_CACHE_SIZE = 50
+
+# CSV rows are bulk-loaded into the REVIEWS_STAGE temporary table (keyed by
+# bank name) and then moved into REVIEWS with one INSERT ... SELECT.
+STAGE_REVIEW_SQL = (
+    "INSERT INTO REVIEWS_STAGE ("
+    " REVIEW_TEXT, RATING, REVIEW_DATE, BANK_NAME, SOURCE,"
+    " CLEANED_TEXT, SENTIMENT_LABEL, SENTIMENT_SCORE,"
+    " KEYWORDS, THEMES"
+    ") VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10)"
+)
+
+# Bind types for STAGE_REVIEW_SQL, pinned so Oracle does not re-describe per batch
+REVIEW_INPUT_SIZES = (
+    oracledb.DB_TYPE_LONG,  # REVIEW_TEXT (CLOB)
+    oracledb.DB_TYPE_NUMBER,  # RATING
+    oracledb.DB_TYPE_DATE,  # REVIEW_DATE
+    None,  # BANK_NAME
+    None,  # SOURCE
+    oracledb.DB_TYPE_LONG,  # CLEANED_TEXT (CLOB)
+    None,  # SENTIMENT_LABEL
+    oracledb.DB_TYPE_NUMBER,  # SENTIMENT_SCORE
+    oracledb.DB_TYPE_LONG,  # KEYWORDS (CLOB)
+    oracledb.DB_TYPE_LONG,  # THEMES (CLOB)
+)
+
+COUNT_UNKNOWN_BANKS_SQL = (
+    "SELECT s.BANK_NAME, COUNT(*) FROM REVIEWS_STAGE s"
+    " WHERE NOT EXISTS (SELECT 1 FROM BANKS b WHERE b.NAME = s.BANK_NAME)"
+    " GROUP BY s.BANK_NAME"
+)
+
+MOVE_STAGED_REVIEWS_SQL = (
+    "INSERT INTO REVIEWS ("
+    " REVIEW_TEXT, RATING, REVIEW_DATE, BANK_ID, SOURCE,"
+    " CLEANED_TEXT, SENTIMENT_LABEL, SENTIMENT_SCORE,"
+    " KEYWORDS, THEMES"
+    ") SELECT"
+    " s.REVIEW_TEXT, s.RATING, s.REVIEW_DATE, b.ID, s.SOURCE,"
+    " s.CLEANED_TEXT, s.SENTIMENT_LABEL, s.SENTIMENT_SCORE,"
+    " s.KEYWORDS, s.THEMES"
+    " FROM REVIEWS_STAGE s JOIN BANKS b ON b.NAME = s.BANK_NAME"
+)
+
 
 # ─────────────────────────────
 # 🔧 Helpers
 # ─────────────────────────────
+@functools.lru_cache(maxsize=8192)
 def format_json_field(raw: str) -> str:
     """
     Convert a stringified list with single quotes to valid JSON string.
-    Returns '[]' if invalid.
+    Python-style literals are parsed directly; falls back to JSON parsing.
+    Returns '[]' if invalid or not a list. Results are cached, so the
+    warning for a bad value is logged once per distinct value.
     """
     try:
-        return json.dumps(json.loads(raw.replace("'", '"')))
-    except json.JSONDecodeError:
-        logging.warning(f"⚠️ Failed to parse JSON field: {raw}")
+        parsed = ast.literal_eval(raw)
+    except (ValueError, SyntaxError):
+        try:
+            parsed = json.loads(raw)
+        except json.JSONDecodeError:
+            logging.warning(f"⚠️ Failed to parse JSON field: {raw}")
+            return "[]"
+    # literal_eval also accepts sets, tuples, complex numbers, ...
+    if not isinstance(parsed, list):
+        logging.warning(f"⚠️ JSON field is not a list: {raw}")
         return "[]"
+    return json.dumps(parsed, separators=(",", ":"))
+
+
+def iter_review_batches(
+    csv_path: str, batch_size: int = BATCH_SIZE
+) -> Iterator[List[Tuple]]:
+    """
+    Stream the CSV and yield lists of review tuples ready for STAGE_REVIEW_SQL.
+    Only one batch is held in memory at a time.
+    """
+    with open(csv_path, mode="r", encoding="utf-8", newline="") as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return
+        idx = {name: i for i, name in enumerate(header)}
+        i_review, i_rating, i_date = idx["review_text"], idx["rating"], idx["date"]
+        i_bank, i_source, i_cleaned = idx["bank"], idx["source"], idx["cleaned_text"]
+        i_label, i_score = idx["sentiment_label"], idx["sentiment_score"]
+        i_keywords, i_themes = idx["keywords"], idx["themes"]
+
+        batch: List[Tuple] = []
+        for row in reader:
+            batch.append(
+                (
+                    row[i_review],
+                    float(row[i_rating]),
+                    date.fromisoformat(row[i_date]),
+                    row[i_bank],
+                    row[i_source],
+                    row[i_cleaned],
+                    row[i_label],
+                    float(row[i_score]),
+                    format_json_field(row[i_keywords]),
+                    format_json_field(row[i_themes]),
+                )
+            )
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+
+def stage_review_batch(cursor, batch: List[Tuple]) -> int:
+    """
+    Load a batch of review tuples into REVIEWS_STAGE with a single executemany()
+    round-trip. Rows rejected by Oracle are logged and skipped instead of
+    aborting the load. Returns the number of rows staged.
+    """
+    cursor.setinputsizes(*REVIEW_INPUT_SIZES)
+    cursor.executemany(STAGE_REVIEW_SQL, batch, batcherrors=True)
+    errors = cursor.getbatcherrors()
+    for error in errors:
+        logging.warning(
+            f"⚠️ Failed to stage review at batch offset {error.offset}: "
+            f"{error.message}"
+        )
+    return len(batch) - len(errors)
 
 
 def insert_reviews_from_csv(csv_path: str) -> None:
@@ -67,7 +198,10 @@ def insert_reviews_from_csv(csv_path: str) -> None:
 
     try:
         with oracledb.connect(
-            user=ORACLE_USER, password=ORACLE_PASSWORD, dsn=DSN
+            user=ORACLE_USER,
+            password=ORACLE_PASSWORD,
+            dsn=DSN,
+            stmtcachesize=STATEMENT_CACHE_SIZE,
         ) as conn:
             with conn.cursor() as cursor:
                 # Log tables in current schema
@@ -77,63 +211,34 @@ def insert_reviews_from_csv(csv_path: str) -> None:
 
                 # Insert the three banks first (if not exists)
                 banks = ["BOA", "Dashen", "CBE"]
-                for bank_name in banks:
-                    try:
-                        cursor.execute(
-                            "INSERT INTO BANKS (NAME) VALUES (:name)", [bank_name]
-                        )
-                    except oracledb.IntegrityError:
-                        # Bank already exists, skip
-                        pass
+                cursor.executemany(MERGE_BANK_SQL, [(name,) for name in banks])
                 conn.commit()
                 logging.info("✅ Banks table populated with initial banks.")
 
-                # Build name→ID mapping
-                cursor.execute("SELECT ID, NAME FROM BANKS")
-                bank_name_to_id = {name: id for id, name in cursor.fetchall()}
-
-                # Then proceed to read and insert rows
-                with open(csv_path, mode="r", encoding="utf-8") as file:
-                    reader = csv.DictReader(file)
-                    for row in reader:
-                        bank_name = row["bank"]
-                        bank_id = bank_name_to_id.get(bank_name)
-                        if bank_id is None:
-                            logging.warning(
-                                f"⚠️ Skipping review for unknown bank: {bank_name}"
-                            )
-                            continue
-
-                        cursor.execute(
-                            (
-                                "INSERT INTO REVIEWS ("
-                                " REVIEW_TEXT, RATING, REVIEW_DATE, BANK_ID, SOURCE,"
-                                " CLEANED_TEXT, SENTIMENT_LABEL, SENTIMENT_SCORE,"
-                                " KEYWORDS, THEMES"
-                                ") VALUES ("
-                                ":review_text, :rating, TO_DATE(:date_value, "
-                                "'YYYY-MM-DD'),"
-                                " :bank_id, :source_value, :cleaned_text, "
-                                ":sentiment_label,"
-                                " :sentiment_score, :keywords, :themes"
-                                ")"
-                            ),
-                            {
-                                "review_text": row["review_text"],
-                                "rating": float(row["rating"]),
-                                "date_value": row["date"],
-                                "bank_id": bank_name_to_id[row["bank"]],
-                                "source_value": row["source"],
-                                "cleaned_text": row["cleaned_text"],
-                                "sentiment_label": row["sentiment_label"],
-                                "sentiment_score": float(row["sentiment_score"]),
-                                "keywords": format_json_field(row["keywords"]),
-                                "themes": format_json_field(row["themes"]),
-                            },
-                        )
+                # Stream the CSV into the staging table in batches
+                staged = 0
+                for batch in iter_review_batches(csv_path):
+                    staged += stage_review_batch(cursor, batch)
+                logging.info(f"📦 Staged {staged} reviews from the CSV.")
+
+                cursor.execute(COUNT_UNKNOWN_BANKS_SQL)
+                for bank_name, count in cursor.fetchall():
+                    logging.warning(
+                        f"⚠️ Skipping {count} review(s) for unknown bank: {bank_name}"
+                    )
 
+                # Resolve BANK_ID in the database and move everything at once;
+                # the commit also empties the ON COMMIT DELETE ROWS stage table
+                cursor.execute(MOVE_STAGED_REVIEWS_SQL)
+                inserted = cursor.rowcount
                 conn.commit()
-                logging.info("✅ Data inserted successfully.")
+                logging.info(
+                    f"✅ Inserted {inserted} of {staged} staged reviews successfully."
+                )
+                cache = format_json_field.cache_info()
+                logging.info(
+                    f"JSON field cache: {cache.hits} hits, {cache.misses} misses."
+                )
 
     except oracledb.DatabaseError as db_err:
         logging.error(f"❌ Database error: {db_err}")
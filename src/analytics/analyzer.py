@@ -1,11 +1,16 @@
+import json
+
 import pandas as pd
-from typing import Dict, List, Union, Optional
+from typing import Dict, Union, Optional
 from collections import defaultdict
+import functools
 import logging
-from rich.table import Table
-from rich.console import Console
 
-console = Console()
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # optional: fall back to pandas string ops
+    pa = None
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -17,6 +22,14 @@ handler.setFormatter(formatter)
 logger.addHandler(handler)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_console():
+    """Create the rich console on first use so rich is only imported for display."""
+    from rich.console import Console
+
+    return Console()
+
+
 class ReviewAnalyzer:
     """
     A class for analyzing bank customer reviews to extract
@@ -25,9 +38,15 @@ class ReviewAnalyzer:
     Attributes:
         df (pd.DataFrame): The input review data with required columns:
             ['bank_name', 'REVIEW_TEXT', 'RATING', 'SENTIMENT_LABEL', 'THEMES'].
+            Only bank_name, SENTIMENT_LABEL and THEMES are kept internally.
+            The analyzer owns its copy and adds a parsed `theme_list` column
+            at init; callers should not mutate `self.df`.
+        theme_counts (pd.DataFrame, optional): Pre-aggregated theme counts,
+            e.g. from OracleReviewLoader.fetch_theme_counts(). When given,
+            summaries are built from it instead of exploding df.
     """
 
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, theme_counts: Optional[pd.DataFrame] = None):
         if not all(
             col in df.columns
             for col in [
@@ -43,18 +62,93 @@ class ReviewAnalyzer:
                 "'RATING', 'SENTIMENT_LABEL', 'THEMES'] columns."
             )
 
-        self.df = df.copy()
+        # Only these columns are read downstream; skip copying review text
+        self.df = df[["bank_name", "SENTIMENT_LABEL", "THEMES"]].copy()
+        # Low-cardinality keys: categorical codes make masks and groupbys cheap
+        self.df["SENTIMENT_LABEL"] = self.df["SENTIMENT_LABEL"].astype("category")
+        self.df["bank_name"] = self.df["bank_name"].astype("category")
+        self.theme_counts = theme_counts
         self.insights: Optional[Dict[str, Dict[str, Dict[str, int]]]] = None
         logger.info(f"Initializing analyzer with {len(self.df)} reviews.")
-        self.df["theme_list"] = self.df["THEMES"].apply(self._parse_themes)
+        self.df["theme_list"] = self._parse_themes(self.df["THEMES"])
+
+    @staticmethod
+    def _parse_themes(themes: pd.Series) -> pd.Series:
+        """
+        Splits themes into cleaned, lower-cased lists. Entries may be JSON
+        arrays ('["Reliability", "User Experience"]', as stored in Oracle)
+        or comma-separated strings; either way the result matches the
+        LOWER(TRIM(theme)) names of OracleReviewLoader.fetch_theme_counts().
+        Non-string and blank entries become empty lists.
+
+        Uses Arrow compute kernels when pyarrow is installed and falls back
+        to pandas string methods otherwise.
+        """
+        themes = ReviewAnalyzer._json_themes_to_csv(themes)
+        if pa is not None:
+            try:
+                return ReviewAnalyzer._parse_themes_arrow(themes)
+            except pa.ArrowException:
+                logger.debug("Arrow theme parsing failed; using pandas fallback.")
+
+        if themes.dtype != object:
+            themes = themes.astype(object)
+        normalized = (
+            themes.str.lower()
+            .str.replace(r"\s*(?:,\s*)+", ",", regex=True)
+            .str.strip()
+            .str.strip(",")
+            .fillna("")
+        )
+        theme_list = normalized.str.split(",")
+        empty = normalized == ""
+        theme_list[empty] = pd.Series(
+            [[] for _ in range(int(empty.sum()))], index=theme_list.index[empty]
+        )
+        return theme_list
 
-    def _parse_themes(self, theme_str: str) -> List[str]:
+    @staticmethod
+    def _json_themes_to_csv(themes: pd.Series) -> pd.Series:
         """
-        Splits comma-separated themes and returns them as a cleaned list.
+        Rewrite JSON-array entries as comma-separated strings so they split
+        like plain entries. Each distinct entry is decoded once.
         """
-        if not isinstance(theme_str, str):
-            return []
-        return [t.strip().lower() for t in theme_str.split(",") if t.strip()]
+        values = themes.to_numpy(dtype=object)
+        decoded = {}
+        for raw in pd.unique(values):
+            if not (isinstance(raw, str) and raw.lstrip().startswith("[")):
+                continue
+            try:
+                items = json.loads(raw)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(items, list):
+                decoded[raw] = ",".join(t for t in items if isinstance(t, str))
+        if not decoded:
+            return themes
+        return pd.Series(
+            [decoded.get(raw, raw) for raw in values], index=themes.index, dtype=object
+        )
+
+    @staticmethod
+    def _parse_themes_arrow(themes: pd.Series) -> pd.Series:
+        """
+        Arrow implementation of _parse_themes returning a list<string> column.
+        Raises pyarrow.ArrowException if the column holds non-string values.
+        """
+        arr = pa.array(
+            themes.to_numpy(dtype=object), type=pa.string(), from_pandas=True
+        )
+        normalized = pc.utf8_lower(arr)
+        normalized = pc.replace_substring_regex(normalized, r"\s*(?:,\s*)+", ",")
+        normalized = pc.utf8_trim(pc.utf8_trim_whitespace(normalized), ",")
+        normalized = pc.if_else(
+            pc.equal(normalized, ""), pa.scalar(None, pa.string()), normalized
+        )
+        theme_list = pc.fill_null(
+            pc.split_pattern(normalized, ","), pa.scalar([], pa.list_(pa.string()))
+        )
+        return pd.Series(pd.arrays.ArrowExtensionArray(theme_list), index=themes.index)
 
     def analyze_per_bank(
         self,
@@ -71,72 +165,43 @@ class ReviewAnalyzer:
         insights: Dict[str, Dict[str, Dict[str, int]]] = defaultdict(dict)
 
         try:
-            if "theme_list" not in self.df.columns:
-                self.df["theme_list"] = self.df["THEMES"].apply(
-                    lambda x: [t.strip() for t in x.split(",")] if pd.notnull(x) else []
-                )
+            # One grouped pass over all banks; summary is sorted by count desc
+            summary = self.generate_summary_df()
+            top = summary.groupby(
+                ["bank_name", "SENTIMENT_LABEL"], sort=False, observed=True
+            ).head(top_n)
+            top_themes: Dict[tuple, Dict[str, int]] = defaultdict(dict)
+            for bank, sentiment, theme, count in top.itertuples(index=False):
+                top_themes[(bank, sentiment)][theme] = count
 
             for bank in self.df["bank_name"].unique():
-                bank_df = self.df[self.df["bank_name"] == bank]
-
-                pos_themes = (
-                    bank_df[bank_df["SENTIMENT_LABEL"] == "positive"]
-                    .explode("theme_list")["theme_list"]
-                    .value_counts()
-                    .head(top_n)
-                    .to_dict()
-                )
-
-                neg_themes = (
-                    bank_df[bank_df["SENTIMENT_LABEL"] == "negative"]
-                    .explode("theme_list")["theme_list"]
-                    .value_counts()
-                    .head(top_n)
-                    .to_dict()
-                )
-
                 insights[bank] = {
-                    "top_drivers": pos_themes,
-                    "top_pain_points": neg_themes,
+                    "top_drivers": top_themes.get((bank, "positive"), {}),
+                    "top_pain_points": top_themes.get((bank, "negative"), {}),
                 }
 
             logger.info(f"Generated insights for {len(insights)} banks.")
 
-            if display:
-                for bank, data in insights.items():
-                    table = Table(title=f"✨ Insights for {bank}", show_lines=True)
-                    table.add_column("Top Drivers", justify="center", style="green")
-                    table.add_column("Count", justify="right", style="green")
-                    table.add_column("Top Pain Points", justify="center", style="red")
-                    table.add_column("Count", justify="right", style="red")
-
-                    max_len = max(
-                        len(data["top_drivers"]), len(data["top_pain_points"])
-                    )
-                    drivers = list(data["top_drivers"].items())
-                    pain_points = list(data["top_pain_points"].items())
-
-                    for i in range(max_len):
-                        d_theme, d_count = drivers[i] if i < len(drivers) else ("", "")
-                        p_theme, p_count = (
-                            pain_points[i] if i < len(pain_points) else ("", "")
-                        )
-                        table.add_row(d_theme, str(d_count), p_theme, str(p_count))
+            self.insights = dict(insights)
 
-                    console.print(table)
+            records = [
+                (bank, sentiment, theme, count)
+                for bank, data in insights.items()
+                for sentiment, key in (
+                    ("positive", "top_drivers"),
+                    ("negative", "top_pain_points"),
+                )
+                for theme, count in data[key].items()
+            ]
+            records_df = pd.DataFrame(
+                records, columns=["bank", "sentiment", "theme", "count"]
+            )
 
-            self.insights = dict(insights)
+            if display:
+                self._display_insights(records_df)
 
             if return_format == "dataframe":
-                records = []
-                for bank, data in insights.items():
-                    for theme, count in data["top_drivers"].items():
-                        records.append((bank, "positive", theme, count))
-                    for theme, count in data["top_pain_points"].items():
-                        records.append((bank, "negative", theme, count))
-                return pd.DataFrame(
-                    records, columns=["bank", "sentiment", "theme", "count"]
-                )
+                return records_df
 
             return dict(insights)
 
@@ -144,20 +209,61 @@ class ReviewAnalyzer:
             logger.error("Error during per-bank analysis.", exc_info=True)
             raise RuntimeError("Bank analysis failed.") from e
 
+    @staticmethod
+    def _display_insights(records_df: pd.DataFrame) -> None:
+        """
+        Print all banks' top drivers and pain points as one rich table.
+        """
+        from rich.table import Table
+
+        table = Table(title="✨ Insights per Bank", show_lines=True)
+        table.add_column("Bank", justify="left", style="bold")
+        table.add_column("Theme", justify="center")
+        table.add_column("Driver Count", justify="right", style="green")
+        table.add_column("Pain Point Count", justify="right", style="red")
+
+        if not records_df.empty:
+            # pivot_table sorts (bank, theme) alphabetically; restore the
+            # records' order: banks as analyzed, drivers then pain points,
+            # each by descending count
+            order = pd.MultiIndex.from_frame(records_df[["bank", "theme"]]).unique()
+            pivot = records_df.pivot_table(
+                index=["bank", "theme"],
+                columns="sentiment",
+                values="count",
+                aggfunc="sum",
+            ).reindex(index=order, columns=["positive", "negative"])
+            for (bank, theme), pos, neg in zip(
+                pivot.index, pivot["positive"], pivot["negative"]
+            ):
+                table.add_row(
+                    str(bank),
+                    str(theme),
+                    "" if pd.isna(pos) else str(int(pos)),
+                    "" if pd.isna(neg) else str(int(neg)),
+                )
+
+        _get_console().print(table)
+
     def generate_summary_df(self) -> pd.DataFrame:
         """
         Generate a summary DataFrame of theme counts grouped by bank and sentiment.
         """
         try:
-            exploded = self.df.explode("theme_list")
-            summary = (
-                exploded.groupby(["bank_name", "SENTIMENT_LABEL", "theme_list"])
-                .size()
-                .reset_index(name="count")
-                .sort_values(
-                    ["bank_name", "SENTIMENT_LABEL", "count"],
-                    ascending=[True, True, False],
+            if self.theme_counts is not None:
+                summary = self.theme_counts
+            else:
+                exploded = self.df.explode("theme_list")
+                summary = (
+                    exploded.groupby(
+                        ["bank_name", "SENTIMENT_LABEL", "theme_list"], observed=True
+                    )
+                    .size()
+                    .reset_index(name="count")
                 )
+            summary = summary.sort_values(
+                ["bank_name", "SENTIMENT_LABEL", "count"],
+                ascending=[True, True, False],
             )
             logger.info(f"Generated summary DataFrame with {len(summary)} rows.")
             return summary
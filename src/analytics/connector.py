@@ -1,7 +1,8 @@
 import pandas as pd
 import oracledb
 import logging
-from typing import Optional
+import threading
+from typing import Dict, Optional, Tuple
 
 # Configure module-level logger
 logger = logging.getLogger(__name__)
@@ -12,6 +13,44 @@ formatter = logging.Formatter("[%(asctime)s] %(levelname)s in %(module)s: %(mess
 handler.setFormatter(formatter)
 logger.addHandler(handler)
 
+# Rows fetched per network round-trip when reading reviews
+FETCH_ARRAYSIZE = 5000
+
+# Session pools shared by all loaders, keyed by (user, dsn)
+_pools: Dict[Tuple[str, str], oracledb.ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool(user: str, password: str, dsn: str) -> oracledb.ConnectionPool:
+    """
+    Return the shared connection pool for this user/DSN, creating it on first use.
+    """
+    key = (user, dsn)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = oracledb.create_pool(
+                user=user,
+                password=password,
+                dsn=dsn,
+                min=1,
+                max=4,
+                increment=1,
+                getmode=oracledb.POOL_GETMODE_WAIT,
+            )
+            _pools[key] = pool
+            logger.info(f"Created Oracle connection pool for {user}@{dsn}.")
+    return pool
+
+
+def _clob_as_string(cursor, name, default_type, size, precision, scale):
+    """
+    Output type handler that fetches CLOB columns directly as strings,
+    avoiding a separate LOB read round-trip per value.
+    """
+    if default_type == oracledb.DB_TYPE_CLOB:
+        return cursor.var(oracledb.DB_TYPE_LONG, arraysize=cursor.arraysize)
+
 
 class OracleReviewLoader:
     """
@@ -22,16 +61,16 @@ class OracleReviewLoader:
         self.user = user
         self.password = password
         self.dsn = dsn
+        self.pool: Optional[oracledb.ConnectionPool] = None
         self.conn: Optional[oracledb.Connection] = None
 
     def connect(self) -> None:
         """
-        Establish a connection to the Oracle database.
+        Acquire a connection to the Oracle database from the shared pool.
         """
         try:
-            self.conn = oracledb.connect(
-                user=self.user, password=self.password, dsn=self.dsn
-            )
+            self.pool = _get_pool(self.user, self.password, self.dsn)
+            self.conn = self.pool.acquire()
             logger.info("Successfully connected to Oracle database.")
         except oracledb.Error as e:
             logger.error(f"Failed to connect to Oracle database: {e}", exc_info=True)
@@ -39,12 +78,16 @@ class OracleReviewLoader:
 
     def disconnect(self) -> None:
         """
-        Close the Oracle database connection.
+        Release the Oracle database connection back to the pool.
         """
         if self.conn:
             try:
-                self.conn.close()
-                logger.info("Oracle database connection closed.")
+                if self.pool is not None:
+                    self.pool.release(self.conn)
+                else:
+                    self.conn.close()
+                self.conn = None
+                logger.info("Oracle database connection released.")
             except oracledb.Error as e:
                 logger.warning(
                     f"Error occurred while closing the database: {e}", exc_info=True
@@ -78,25 +121,29 @@ class OracleReviewLoader:
 
         try:
             cursor = self.conn.cursor()
+            cursor.arraysize = FETCH_ARRAYSIZE
+            cursor.prefetchrows = FETCH_ARRAYSIZE + 1
+            cursor.outputtypehandler = _clob_as_string
             cursor.execute(query)
-            rows = []
 
-            for row in cursor:
-                # Convert CLOBs to string (e.g., from LOBs)
-                clean_row = [col.read() if hasattr(col, "read") else col for col in row]
-                rows.append(clean_row)
-
-            df = pd.DataFrame(
-                rows,
-                columns=[
-                    "bank_name",
-                    "review_text",
-                    "rating",
-                    "sentiment_label",
-                    "keywords",
-                    "themes",
-                ],
-            )
+            # Transpose each fetched batch straight into per-column lists
+            columns = [
+                "bank_name",
+                "review_text",
+                "rating",
+                "sentiment_label",
+                "keywords",
+                "themes",
+            ]
+            data: Dict[str, list] = {name: [] for name in columns}
+            while True:
+                rows = cursor.fetchmany(FETCH_ARRAYSIZE)
+                if not rows:
+                    break
+                for values, column in zip(data.values(), zip(*rows)):
+                    values.extend(column)
+
+            df = pd.DataFrame(data, columns=columns)
 
             logger.info(f"Fetched {len(df)} review records from Oracle DB.")
             return df
@@ -106,3 +153,53 @@ class OracleReviewLoader:
                 "Failed to execute query or load data into DataFrame.", exc_info=True
             )
             raise RuntimeError("Error fetching reviews from Oracle.") from e
+
+    def fetch_theme_counts(self) -> pd.DataFrame:
+        """
+        Count themes per bank and sentiment inside Oracle.
+
+        Themes are stored as JSON arrays, so they are expanded with JSON_TABLE
+        and aggregated server-side; only one row per (bank, sentiment, theme)
+        crosses the network instead of every review.
+
+        Returns:
+            pd.DataFrame: Columns bank_name, SENTIMENT_LABEL, theme_list and
+                          count, matching ReviewAnalyzer.generate_summary_df().
+        """
+        if self.conn is None:
+            self.connect()
+
+        assert self.conn is not None  # for mypy
+
+        query = """
+        SELECT
+            b.NAME AS bank_name,
+            r.SENTIMENT_LABEL,
+            LOWER(TRIM(jt.theme)) AS theme,
+            COUNT(*) AS theme_count
+        FROM REVIEWS r,
+             BANKS b,
+             JSON_TABLE(
+                 r.THEMES, '$[*]' COLUMNS (theme VARCHAR2(200) PATH '$')
+             ) jt
+        WHERE r.BANK_ID = b.ID
+          AND r.SENTIMENT_LABEL IS NOT NULL
+          AND r.THEMES IS NOT NULL
+          AND TRIM(jt.theme) IS NOT NULL
+        GROUP BY b.NAME, r.SENTIMENT_LABEL, LOWER(TRIM(jt.theme))
+        """
+
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(query)
+            df = pd.DataFrame(
+                cursor.fetchall(),
+                columns=["bank_name", "SENTIMENT_LABEL", "theme_list", "count"],
+            )
+
+            logger.info(f"Fetched {len(df)} theme count rows from Oracle DB.")
+            return df
+
+        except Exception as e:
+            logger.error("Failed to aggregate theme counts in Oracle.", exc_info=True)
+            raise RuntimeError("Error fetching theme counts from Oracle.") from e
@@ -1,4 +1,6 @@
+import gc
 import pandas as pd
+import matplotlib.image as mpimg
 import matplotlib.pyplot as plt
 import seaborn as sns
 from wordcloud import WordCloud
@@ -9,6 +11,14 @@ from typing import Optional
 import logging
 from matplotlib.backends.backend_pdf import PdfPages
 import textwrap
+from io import BytesIO
+from PIL import Image
+
+try:
+    import img2pdf
+    from pypdf import PdfWriter
+except ImportError:  # optional: fall back to re-rendering PNGs with matplotlib
+    img2pdf = None
 
 # from matplotlib.backends.backend_pdf import PdfPages
 
@@ -19,6 +29,13 @@ formatter = logging.Formatter("[%(asctime)s] %(levelname)s: %(message)s")
 handler.setFormatter(formatter)
 logger.addHandler(handler)
 
+# Lossless PNG size reduction applied when saving plots
+PNG_PIL_KWARGS = {"optimize": True, "compress_level": 9}
+# Plot PNGs are already rasterized; rendering their pages finer adds nothing
+IMAGE_PAGE_DPI = 100
+# Force collection of closed figures every N image pages
+GC_EVERY_N_PAGES = 10
+
 
 class ReviewVisualizer:
     def __init__(
@@ -26,6 +43,7 @@ class ReviewVisualizer:
         summary_df: pd.DataFrame,
         full_df: pd.DataFrame,
         out_dir: str = "outputs/plots",
+        dpi: int = 150,
     ):
         """
         Initializes the visualizer.
@@ -35,17 +53,25 @@ class ReviewVisualizer:
             full_df (pd.DataFrame): Full DataFrame with raw review data
             (including REVIEW_DATE).out_dir (str): Directory
             to save generated plots.
+            dpi (int): Resolution of saved PNGs; 150 is plenty for the reports.
         """
         self.summary_df = summary_df
         self.full_df = full_df
         self.out_dir = Path(out_dir)
+        self.dpi = dpi
         self.out_dir.mkdir(parents=True, exist_ok=True)
         logger.info(
             f"Visualizer initialized with output path: {self.out_dir.resolve()}"
         )
 
     def plot_top_themes_bar(
-        self, bank: str, sentiment: str = "positive", top_n: int = 5, save: bool = True
+        self,
+        bank: str,
+        sentiment: str = "positive",
+        top_n: int = 5,
+        save: bool = True,
+        subset: Optional[pd.DataFrame] = None,
+        ax: Optional[plt.Axes] = None,
     ):
         """
         Plot bar chart of top themes for a specific bank and sentiment.
@@ -55,34 +81,45 @@ class ReviewVisualizer:
             sentiment (str): Sentiment type ("positive"/"negative").
             top_n (int): Number of top themes to show.
             save (bool): If True, saves the figure.
+            subset (pd.DataFrame, optional): Precomputed top rows for this
+            bank and sentiment; skips filtering summary_df when given.
+            ax (plt.Axes, optional): Axes to clear and draw on, so a caller
+            can reuse one figure across plots. The figure is then left open.
         """
-        subset = self.summary_df[
-            (self.summary_df["bank_name"] == bank)
-            & (self.summary_df["SENTIMENT_LABEL"] == sentiment)
-        ].nlargest(top_n, "count")
+        if subset is None:
+            subset = self.summary_df[
+                (self.summary_df["bank_name"] == bank)
+                & (self.summary_df["SENTIMENT_LABEL"] == sentiment)
+            ].nlargest(top_n, "count")
 
         if subset.empty:
             logger.warning(f"No data for {bank} - {sentiment}")
             return
 
-        plt.figure(figsize=(8, 4))
-        sns.barplot(x="count", y="theme_list", data=subset, palette="viridis")
-        plt.title(f"Top {sentiment.capitalize()} Themes for {bank}")
-        plt.xlabel("Frequency")
-        plt.ylabel("Theme")
-        plt.tight_layout()
+        reuse = ax is not None
+        fig, ax = self._prepare_axes(ax, figsize=(8, 4))
+        sns.barplot(x="count", y="theme_list", data=subset, palette="viridis", ax=ax)
+        ax.set_title(f"Top {sentiment.capitalize()} Themes for {bank}")
+        ax.set_xlabel("Frequency")
+        ax.set_ylabel("Theme")
+        fig.tight_layout()
 
         if save:
             path = self.out_dir / f"{bank}_{sentiment}_bar.png"
-            plt.savefig(path, dpi=300)
+            self._save_figure(fig, path)
             logger.info(f"Saved bar chart: {path}")
         else:
             plt.show()
 
-        plt.close()
+        if not reuse:
+            plt.close(fig)
 
     def plot_theme_wordcloud(
-        self, bank: Optional[str] = None, sentiment: str = "positive", save: bool = True
+        self,
+        bank: Optional[str] = None,
+        sentiment: str = "positive",
+        save: bool = True,
+        ax: Optional[plt.Axes] = None,
     ):
         """
         Plot a word cloud of themes for a given sentiment (optionally by bank).
@@ -91,12 +128,19 @@ class ReviewVisualizer:
             bank (str): Optional bank name to filter.
             sentiment (str): Sentiment type.
             save (bool): If True, saves the figure.
+            ax (plt.Axes, optional): Axes to clear and draw on, so a caller
+            can reuse one figure across plots. The figure is then left open.
         """
         df = self.summary_df[self.summary_df["SENTIMENT_LABEL"] == sentiment]
         if bank:
             df = df[df["bank_name"] == bank]
 
-        freq = df.groupby("theme_list")["count"].sum().to_dict()
+        # summary_df normally has one row per (bank, sentiment, theme), so the
+        # counts can be used as-is; only aggregate when themes repeat
+        if df["theme_list"].duplicated().any():
+            freq = df.groupby("theme_list", sort=False)["count"].sum().to_dict()
+        else:
+            freq = dict(zip(df["theme_list"].to_numpy(), df["count"].to_numpy()))
         if not freq:
             logger.warning(
                 f"No themes for {sentiment} sentiment in {bank or 'all banks'}"
@@ -106,21 +150,25 @@ class ReviewVisualizer:
         wc = WordCloud(width=800, height=400, background_color="white", colormap="Set2")
         wc.generate_from_frequencies(freq)
 
-        plt.figure(figsize=(10, 5))
-        plt.imshow(wc, interpolation="bilinear")
-        plt.axis("off")
-        plt.title(f"{bank or 'All Banks'} - {sentiment.capitalize()} Theme Word Cloud")
-        plt.tight_layout()
+        reuse = ax is not None
+        fig, ax = self._prepare_axes(ax, figsize=(10, 5))
+        ax.imshow(wc, interpolation="bilinear")
+        ax.axis("off")
+        ax.set_title(
+            f"{bank or 'All Banks'} - {sentiment.capitalize()} Theme Word Cloud"
+        )
+        fig.tight_layout()
 
         if save:
             fname = f"{bank or 'all'}_{sentiment}_wordcloud.png".replace(" ", "_")
             path = self.out_dir / fname
-            plt.savefig(path, dpi=300)
+            self._save_figure(fig, path)
             logger.info(f"Saved word cloud: {path}")
         else:
             plt.show()
 
-        plt.close()
+        if not reuse:
+            plt.close(fig)
 
     def plot_sentiment_trend(self, save: bool = True):
         """
@@ -135,12 +183,19 @@ class ReviewVisualizer:
             return
 
         df["REVIEW_DATE"] = pd.to_datetime(df["REVIEW_DATE"])
+        # Bucket by week up front instead of running the resample machinery.
+        # Weeks are labelled by their Sunday end, and asfreq restores empty
+        # weeks as zeros, as pd.Grouper(freq="W") did
+        df["__week"] = df["REVIEW_DATE"].dt.to_period("W").dt.end_time.dt.normalize()
         trend_df = (
-            df.groupby([pd.Grouper(key="REVIEW_DATE", freq="W"), "SENTIMENT_LABEL"])
+            df.groupby(["__week", "SENTIMENT_LABEL"], sort=False, observed=True)
             .size()
-            .unstack()
-            .fillna(0)
+            .unstack(fill_value=0)
+            .sort_index()
+            .sort_index(axis=1)
+            .asfreq("W-SUN", fill_value=0)
         )
+        trend_df.index.name = "REVIEW_DATE"
 
         plt.figure(figsize=(10, 5))
         trend_df.plot(ax=plt.gca(), marker="o")
@@ -151,13 +206,40 @@ class ReviewVisualizer:
 
         if save:
             path = self.out_dir / "sentiment_trend.png"
-            plt.savefig(path, dpi=300)
+            self._save_figure(plt.gcf(), path)
             logger.info(f"Saved sentiment trend: {path}")
         else:
             plt.show()
 
         plt.close()
 
+    @staticmethod
+    def _prepare_axes(ax: Optional[plt.Axes], figsize: tuple):
+        """
+        Return (figure, axes) to draw on: a fresh figure when ax is None,
+        otherwise the given axes cleared of the previous plot.
+        """
+        if ax is None:
+            return plt.subplots(figsize=figsize)
+        ax.clear()
+        return ax.figure, ax
+
+    def _save_figure(self, fig: plt.Figure, path: Path):
+        """
+        Save a figure as a compressed PNG at the visualizer's DPI.
+
+        matplotlib writes RGBA PNGs; the image is flattened onto white and
+        stored as RGB so img2pdf can embed it without building an alpha
+        mask (and older img2pdf does not reject it).
+        """
+        buffer = BytesIO()
+        fig.savefig(
+            buffer, format="png", dpi=self.dpi, bbox_inches="tight", facecolor="white"
+        )
+        buffer.seek(0)
+        with Image.open(buffer) as image:
+            image.convert("RGB").save(path, format="PNG", **PNG_PIL_KWARGS)
+
     def generate_all_visuals_per_bank(self, top_n: int = 5):
         """
         Generate bar + word cloud plots for each bank and sentiment.
@@ -165,10 +247,30 @@ class ReviewVisualizer:
         banks = self.summary_df["bank_name"].unique()
         sentiments = ["positive", "negative"]
 
-        for bank in banks:
-            for sentiment in sentiments:
-                self.plot_top_themes_bar(bank, sentiment, top_n)
-                self.plot_theme_wordcloud(bank, sentiment)
+        # Top rows for every (bank, sentiment) pair from a single sort + groupby
+        keys = ["bank_name", "SENTIMENT_LABEL"]
+        top_rows = (
+            self.summary_df.sort_values("count", ascending=False, kind="stable")
+            .groupby(keys, sort=False, observed=True)
+            .head(top_n)
+        )
+        top_by_pair = dict(tuple(top_rows.groupby(keys, sort=False, observed=True)))
+        empty = self.summary_df.iloc[0:0]
+
+        # One figure per plot type, cleared and redrawn for every pair
+        fig_bar, ax_bar = plt.subplots(figsize=(8, 4))
+        fig_wc, ax_wc = plt.subplots(figsize=(10, 5))
+        try:
+            for bank in banks:
+                for sentiment in sentiments:
+                    subset = top_by_pair.get((bank, sentiment), empty)
+                    self.plot_top_themes_bar(
+                        bank, sentiment, top_n, subset=subset, ax=ax_bar
+                    )
+                    self.plot_theme_wordcloud(bank, sentiment, ax=ax_wc)
+        finally:
+            plt.close(fig_bar)
+            plt.close(fig_wc)
 
     def export_visuals_to_pdf(self, pdf_name: str = "Review_Report.pdf"):
         """
@@ -183,17 +285,39 @@ class ReviewVisualizer:
             return
 
         pdf_path = self.out_dir / pdf_name
-        with PdfPages(pdf_path) as pdf:
-            for img_path in images:
-                img = plt.imread(img_path)
-                fig, ax = plt.subplots(figsize=(10, 6))
-                ax.imshow(img)
-                ax.axis("off")
-                pdf.savefig(fig)
-                plt.close(fig)
+        if img2pdf is not None:
+            # The RGB PNGs from _save_figure go into the PDF as-is, without
+            # decoding or re-rendering
+            pdf_path.write_bytes(img2pdf.convert([str(p) for p in images]))
+        else:
+            with PdfPages(pdf_path) as pdf:
+                self._add_image_pages(pdf, images)
 
         logger.info(f"Exported all visuals to PDF: {pdf_path}")
 
+    def _add_image_pages(self, pdf: PdfPages, images: list):
+        """
+        Append one page per saved plot to an open PDF.
+
+        Each page's figure and decoded image are released right away, with a
+        periodic gc pass, so long reports do not accumulate figure memory.
+
+        Args:
+            pdf (PdfPages): Open PDF being written.
+            images (list of Path): PNG files to include, in page order.
+        """
+        for i, img_path in enumerate(images, start=1):
+            img = mpimg.imread(img_path)
+            fig, ax = plt.subplots(figsize=(10, 6))
+            ax.imshow(img)
+            ax.axis("off")
+            del img
+            pdf.savefig(fig, dpi=IMAGE_PAGE_DPI)
+            plt.close(fig)
+            del fig, ax
+            if i % GC_EVERY_N_PAGES == 0:
+                gc.collect()
+
     def add_insights(self, insights: dict):
         """
         Store insights dict to include in the report.
@@ -271,7 +395,12 @@ class ReviewVisualizer:
                 logger.warning("No analyzer or insights found.")
                 self.insights = {}
 
-        with PdfPages(pdf_path) as pdf:
+        # With img2pdf the text pages are rendered to memory and the PNGs are
+        # appended to them unchanged; otherwise everything goes via matplotlib
+        embed_images = img2pdf is not None and bool(images)
+        text_pdf = BytesIO() if embed_images else pdf_path
+
+        with PdfPages(text_pdf) as pdf:
             # Add insight summary per bank
             for bank, bank_insights in self.insights.items():
                 drivers = bank_insights.get("top_drivers", {})
@@ -301,13 +430,15 @@ class ReviewVisualizer:
                 pdf.savefig(rec_fig)
                 plt.close(rec_fig)
 
-            # Add image pages
-            for img_path in images:
-                img = plt.imread(img_path)
-                fig, ax = plt.subplots(figsize=(10, 6))
-                ax.imshow(img)
-                ax.axis("off")
-                pdf.savefig(fig)
-                plt.close(fig)
+            if not embed_images:
+                # Add image pages
+                self._add_image_pages(pdf, images)
+
+        if embed_images:
+            writer = PdfWriter()
+            if text_pdf.getbuffer().nbytes:  # nothing is written without pages
+                writer.append(text_pdf)
+            writer.append(BytesIO(img2pdf.convert([str(p) for p in images])))
+            writer.write(pdf_path)
 
         logger.info(f"Exported combined visuals and insights report: {pdf_path}")
@@ -1,10 +1,18 @@
 import os
 import time
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
 
+import numpy as np
 import pandas as pd
 from google_play_scraper import Sort, reviews
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # optional: fall back to DataFrame.to_csv
+    pa = None
+
 
 class PlayStoreReviewScraper:
     def __init__(self, app_id: str, bank_name: str, max_reviews: int = 1000):
@@ -13,7 +21,8 @@ class PlayStoreReviewScraper:
         self.max_reviews = max_reviews
 
     def fetch_reviews(self) -> pd.DataFrame:
-        all_reviews = []
+        # Accumulate one list per review field instead of a list of dicts
+        columns: Dict[str, list] = {}
         count = 0
         continuation_token = None
 
@@ -37,8 +46,13 @@ class PlayStoreReviewScraper:
                 if not rvws:
                     break
 
-                all_reviews.extend(rvws)
-                count = len(all_reviews)
+                # Keep every column the same length when pages (or reviews)
+                # differ in fields: new fields are backfilled with None
+                for key in dict.fromkeys(key for r in rvws for key in r):
+                    columns.setdefault(key, [None] * count)
+                for key, values in columns.items():
+                    values.extend(r.get(key) for r in rvws)
+                count += len(rvws)
 
                 if continuation_token is None:
                     break  # No more pages
@@ -46,7 +60,10 @@ class PlayStoreReviewScraper:
         except Exception as e:
             print(f"[ERROR] Failed to fetch reviews for {self.bank_name}: {e}")
 
-        return pd.DataFrame(all_reviews)
+        df = pd.DataFrame(columns)
+        if "score" in df.columns:
+            df["score"] = pd.to_numeric(df["score"], downcast="integer")
+        return df
 
 
 class ReviewPreprocessor:
@@ -54,55 +71,132 @@ class ReviewPreprocessor:
     def clean_reviews(df: pd.DataFrame, bank_name: str) -> pd.DataFrame:
         if df.empty:
             return pd.DataFrame()
-        df = df[["content", "score", "at"]].copy()
-        df.rename(
-            columns={"content": "review", "score": "rating", "at": "date"}, inplace=True
+        df = pd.DataFrame(
+            {
+                "review": df["content"],
+                "rating": df["score"],
+                # ISO date strings straight from datetime64, no date objects
+                "date": pd.to_datetime(df["at"]).dt.strftime("%Y-%m-%d"),
+            }
+        )
+        # Drop duplicates of (review, date), then rows missing review or
+        # rating, with a single row selection
+        keep = ~df.duplicated(subset=["review", "date"])
+        keep &= df["review"].notna() & df["rating"].notna()
+        df = df[keep]
+        # Constant per bank, so store as single-category columns (all codes 0)
+        # rather than repeated strings
+        codes = np.zeros(len(df), dtype=np.int8)
+        return df.assign(
+            bank=pd.Categorical.from_codes(codes, categories=[bank_name]),
+            source=pd.Categorical.from_codes(codes, categories=["Google Play"]),
         )
-        df["date"] = pd.to_datetime(df["date"]).dt.date.astype(str)
-        df.drop_duplicates(subset=["review", "date"], inplace=True)
-        df.dropna(subset=["review", "rating"], inplace=True)
-        df.loc[:, "bank"] = bank_name
-        df.loc[:, "source"] = "Google Play"
-        return df
 
 
-def scrape_all_banks(
-    app_dict: Dict[str, str], output_path: str, max_reviews: int = 1000
-):
-    all_dfs = []
-    for bank, app_id in app_dict.items():
-        print(f"[INFO] Scraping {bank}...")
-        scraper = PlayStoreReviewScraper(app_id, bank, max_reviews)
-        raw_df = scraper.fetch_reviews()
-
-        # Save raw data
-        raw_path = f"data/raw/{bank}_raw_reviews.csv"
-        os.makedirs(os.path.dirname(raw_path), exist_ok=True)
-        raw_df.to_csv(raw_path, index=False)
-        print(f"[INFO] Saved raw data for {bank} to {raw_path}")
-
-        # Clean and validate
-        clean_df = ReviewPreprocessor.clean_reviews(raw_df, bank)
-        if len(clean_df) < 400:
-            print(
-                f"[WARNING] Only {len(clean_df)} cleaned reviews/ found for {bank} "
-                f"(expected: 400+)"
+# Upper bound on concurrent Play Store requests
+MAX_SCRAPE_WORKERS = 8
+
+
+def _as_pandas_text(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Render float, datetime and bool columns as the strings DataFrame.to_csv
+    writes for them ("1.0", "2024-01-01 10:00:00", "True"), so Arrow's
+    writer does not print "1", nanosecond timestamps or "true" instead.
+    Missing values stay missing and are written as empty fields.
+    """
+    formatted = {
+        name: col.astype(str).where(col.notna())
+        for name, col in df.items()
+        if pd.api.types.is_float_dtype(col)
+        or pd.api.types.is_datetime64_any_dtype(col)
+        or pd.api.types.is_bool_dtype(col)
+        # bools mixed with None stay object dtype
+        or pd.api.types.infer_dtype(col, skipna=True) == "boolean"
+    }
+    return df.assign(**formatted) if formatted else df
+
+
+def _write_csv(df: pd.DataFrame, path: str, append: bool = False):
+    """
+    Write df to path without the index, using Arrow's native writer if available.
+    With append=True the rows are added to an existing file without a header.
+
+    Values match DataFrame.to_csv, but Arrow quotes every string field and
+    header ("CBE" rather than CBE); CSV readers parse both the same way.
+    """
+    if pa is not None:
+        try:
+            table = pa.Table.from_pandas(_as_pandas_text(df), preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            table = None  # mixed-type object column; let pandas handle it
+        if table is not None:
+            options = pacsv.WriteOptions(
+                include_header=not append, quoting_style="needed"
             )
+            with open(path, "ab" if append else "wb") as sink:
+                pacsv.write_csv(table, sink, write_options=options)
+            return
+    df.to_csv(path, index=False, mode="a" if append else "w", header=not append)
 
-        # Save cleaned per bank
-        clean_path = f"data/processed/{bank}_cleaned_reviews.csv"
-        clean_df.to_csv(clean_path, index=False)
-        print(f"[INFO] Saved cleaned data for {bank} to {clean_path}")
 
-        if not clean_df.empty:
-            all_dfs.append(clean_df)
+def _scrape_one(
+    bank: str, app_id: str, max_reviews: int
+) -> Tuple[str, pd.DataFrame, pd.DataFrame]:
+    """Fetch and clean reviews for one bank; runs on a worker thread."""
+    print(f"[INFO] Scraping {bank}...")
+    scraper = PlayStoreReviewScraper(app_id, bank, max_reviews)
+    raw_df = scraper.fetch_reviews()
+    clean_df = ReviewPreprocessor.clean_reviews(raw_df, bank)
+    return bank, raw_df, clean_df
 
-    if all_dfs:
-        final_df = pd.concat(all_dfs, ignore_index=True)
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        final_df.to_csv(output_path, index=False)
+
+def scrape_all_banks(
+    app_dict: Dict[str, str], output_path: str, max_reviews: int = 1000
+):
+    max_workers = max(1, min(MAX_SCRAPE_WORKERS, len(app_dict)))
+    combined_rows = 0
+
+    # Fetches are network-bound, so run them concurrently; file writes stay
+    # on the main thread. Results are consumed in input order so each bank is
+    # appended to the combined CSV as soon as it is ready, without holding
+    # every bank in memory for a final concat.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_scrape_one, bank, app_id, max_reviews)
+            for bank, app_id in app_dict.items()
+        ]
+        while futures:
+            # pop so the finished future drops its DataFrames after this pass
+            bank, raw_df, clean_df = futures.pop(0).result()
+
+            # Save raw data
+            raw_path = f"data/raw/{bank}_raw_reviews.csv"
+            os.makedirs(os.path.dirname(raw_path), exist_ok=True)
+            _write_csv(raw_df, raw_path)
+            print(f"[INFO] Saved raw data for {bank} to {raw_path}")
+
+            # Validate cleaned data
+            if len(clean_df) < 400:
+                print(
+                    f"[WARNING] Only {len(clean_df)} cleaned reviews/ found for {bank} "
+                    f"(expected: 400+)"
+                )
+
+            # Save cleaned per bank
+            clean_path = f"data/processed/{bank}_cleaned_reviews.csv"
+            _write_csv(clean_df, clean_path)
+            print(f"[INFO] Saved cleaned data for {bank} to {clean_path}")
+
+            # Append to the combined dataset
+            if not clean_df.empty:
+                if combined_rows == 0:
+                    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+                _write_csv(clean_df, output_path, append=combined_rows > 0)
+                combined_rows += len(clean_df)
+
+    if combined_rows:
         print(
-            f"[SUCCESS] Saved combined dataset with {len(final_df)} reviews "
+            f"[SUCCESS] Saved combined dataset with {combined_rows} reviews "
             f"to {output_path}"
         )
 
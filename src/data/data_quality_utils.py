@@ -1,34 +1,243 @@
 import asyncio
+import functools
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import emoji
 import nest_asyncio
+import numpy as np
 import pandas as pd
-from googletrans import Translator
+from pandas.api.types import (
+    is_datetime64_any_dtype,
+    is_numeric_dtype,
+    is_object_dtype,
+    is_string_dtype,
+    is_unsigned_integer_dtype,
+)
+from googletrans import LANGUAGES as GOOGLETRANS_LANGUAGES, Translator
 from langdetect import detect
 from langdetect.lang_detect_exception import LangDetectException
+from analytics.path_config import MODELS_DIR
 from utils.emoji_map import DEFAULT_EMOJI_MAP
 
+try:
+    import fasttext
+except ImportError:  # optional: fall back to per-text langdetect
+    fasttext = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # optional: fall back to per-cell Python checks
+    pa = None
+
 
 nest_asyncio.apply()
 
+_WHITESPACE = re.compile(r"\s+")
+_ISO_DATE_PREFIX = re.compile(r"\d{4}-\d{2}-\d{2}")
+# Placeholder strings treated as missing dates
+_DATE_PLACEHOLDERS = ["", "nan", "null", "None", "NaT", "N/A"]
+
+# Upper bound on in-flight translation requests
+MAX_CONCURRENT_TRANSLATIONS = 16
+
+# Detector codes googletrans spells differently (older releases lack "zh")
+_GOOGLETRANS_ALIASES = {"zh": "zh-cn", "he": "iw", "jv": "jw"}
+
+# Distinct texts whose langdetect result is memoized by _detect
+DETECTION_CACHE_SIZE = 65_536
+
+# fastText language-identification model (download lid.176.bin from fasttext.cc)
+FASTTEXT_LID_MODEL = MODELS_DIR / "lid.176.bin"
+
+
+@functools.lru_cache(maxsize=1)
+def _load_language_model():
+    """
+    Load the fastText language-identification model once.
+    Returns None when fasttext or the model file is unavailable.
+    """
+    if fasttext is None or not FASTTEXT_LID_MODEL.exists():
+        return None
+    return fasttext.load_model(str(FASTTEXT_LID_MODEL))
+
+
+@functools.lru_cache(maxsize=DETECTION_CACHE_SIZE)
+def _detect(text: str) -> Optional[str]:
+    """langdetect for a single text, memoized; None if undetectable."""
+    try:
+        return detect(text)
+    except LangDetectException:
+        return None
+
+
+def _googletrans_src(lang: str) -> str:
+    """
+    Translate a fastText/langdetect language code into a googletrans source
+    code, or "auto" (let Google detect it) when googletrans does not know it.
+    """
+    lang = lang.lower()
+    if lang in GOOGLETRANS_LANGUAGES:
+        return lang
+    alias = _GOOGLETRANS_ALIASES.get(lang)
+    return alias if alias in GOOGLETRANS_LANGUAGES else "auto"
+
+
+def detect_languages(texts: List[str]) -> List[Optional[str]]:
+    """
+    Detect the language code of each text, e.g. "en".
+
+    Each distinct text is detected once. Uses a single batched fastText
+    prediction when the model is available and falls back to langdetect
+    per text otherwise. Blank or undetectable texts get None.
+    """
+    unique = [text for text in dict.fromkeys(texts) if text.strip()]
+    if not unique:
+        return [None] * len(texts)
+
+    model = _load_language_model()
+    if model is not None:
+        # fastText predicts one line per text, so newlines must go
+        labels, _ = model.predict([text.replace("\n", " ") for text in unique], k=1)
+        found = {
+            text: label[0].replace("__label__", "", 1)
+            for text, label in zip(unique, labels)
+        }
+    else:
+        found = {text: _detect(text) for text in unique}
+    return [found.get(text) for text in texts]
+
+
+def _invalid_value_mask(obj: pd.DataFrame, invalid: frozenset) -> np.ndarray:
+    """
+    Boolean (rows x columns) mask of cells whose stripped text is in
+    `invalid`. Uses Arrow string kernels when pyarrow is installed.
+    """
+    if pa is not None:
+        try:
+            return np.column_stack(
+                [
+                    obj[col]
+                    .astype("string[pyarrow]")
+                    .str.strip()
+                    .isin(invalid)
+                    .fillna(False)
+                    .to_numpy(dtype=bool)
+                    for col in obj.columns
+                ]
+            )
+        except (TypeError, ValueError, pa.ArrowException):
+            pass  # values Arrow cannot cast; use the Python path below
+
+    is_invalid = np.frompyfunc(lambda v: str(v).strip() in invalid, 1, 1)
+    return is_invalid(obj.to_numpy(dtype=object)).astype(bool)
+
+
+def _format_percent(percent: pd.Series) -> pd.Series:
+    """Format percentages as "12.34%" strings in one vectorized call."""
+    return pd.Series(
+        np.char.mod("%.2f%%", percent.to_numpy(dtype=float)), index=percent.index
+    )
+
+
+def _to_utc_datetime(col_data: pd.Series, errors: str) -> pd.Series:
+    """
+    Parse a column to UTC datetimes. Columns that look like ISO 8601 go
+    through pandas' C ISO parser first; anything else, or any column it
+    rejects, falls back to inferring the format of each element.
+    """
+    if is_numeric_dtype(col_data):
+        # Epoch values; unsigned ints take a much slower conversion path
+        if is_unsigned_integer_dtype(col_data):
+            col_data = col_data.astype("int64")
+        return pd.to_datetime(col_data, errors=errors, utc=True)
+
+    if is_object_dtype(col_data) or is_string_dtype(col_data):
+        # Strip strings (other objects, e.g. datetimes, are kept) and turn
+        # placeholders into missing values, so they become NaT even when
+        # the ISO attempt below raises on anything unparseable
+        stripped = col_data.str.strip()
+        col_data = stripped.where(stripped.notna(), col_data).mask(
+            stripped.isin(_DATE_PLACEHOLDERS)
+        )
+
+    # Peek at the first value so non-ISO columns skip the ISO attempt
+    valid = col_data.notna().to_numpy()
+    first = col_data.iat[valid.argmax()] if valid.any() else None
+    if isinstance(first, str) and _ISO_DATE_PREFIX.match(first):
+        try:
+            return pd.to_datetime(
+                col_data, errors="raise", utc=True, cache=True, format="ISO8601"
+            )
+        except (TypeError, ValueError):
+            pass
+    return pd.to_datetime(col_data, errors=errors, utc=True, cache=True, format="mixed")
+
 
 class DataQualityUtils:
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, copy: bool = False):
+        """
+        Args:
+            df (pd.DataFrame): Data to check and clean. It is never modified.
+            copy (bool): Copy `df` up front. By default the caller's frame
+                is shared and only copied by the first in-place change, so
+                read-only checks cost no extra memory. Statistics such as
+                missing and duplicate counts are only cached once the frame
+                is owned, since the caller may still change a shared one.
+        """
         if not isinstance(df, pd.DataFrame):
             raise TypeError("Input must be a pandas DataFrame")
-        self.df = df.copy()
+        self.df = df.copy() if copy else df
+        self._owns_df = copy
+        self._missing_cache: Optional[pd.Series] = None
+        # DataFrame.duplicated masks by `keep` value; see _duplicated
+        self._duplicated_cache: Dict[Any, np.ndarray] = {}
         self.translator = Translator()
+        # Successful translations by source text, reused across calls
+        self._trans_cache: Dict[str, str] = {}
+
+    def _ensure_owned(self):
+        """
+        Prepare for an in-place modification: copy the caller's DataFrame
+        the first time and drop cached statistics.
+        """
+        if not self._owns_df:
+            self.df = self.df.copy()
+            self._owns_df = True
+        self._missing_cache = None
+        self._duplicated_cache = {}
+
+    def _replace_df(self, df: pd.DataFrame):
+        """
+        Swap in a newly built DataFrame and drop cached statistics.
+        """
+        self.df = df
+        self._owns_df = True
+        self._missing_cache = None
+        self._duplicated_cache = {}
+
+    @property
+    def missing_counts(self) -> pd.Series:
+        """
+        Per-column count of missing values, cached until the DataFrame changes
+        (only while the DataFrame is owned; see __init__).
+        """
+        if self._missing_cache is not None:
+            return self._missing_cache
+        counts = self.df.isna().sum()
+        if self._owns_df:
+            self._missing_cache = counts
+        return counts
 
     def clean_column_names(self):
         """
         Standardize column names: lowercase, strip spaces,
         and replace spaces with underscores.
         """
-        self.df.columns = (
-            self.df.columns.str.strip().str.lower().str.replace(" ", "_", regex=False)
-        )
+        self._ensure_owned()
+        self.df.columns = [
+            col.strip().lower().replace(" ", "_") for col in self.df.columns
+        ]
         return self.df
 
     def drop_redundant_columns(self):
@@ -36,8 +245,8 @@ class DataQualityUtils:
         Drops commonly redundant columns like 'unnamed: 0' or exact duplicates.
         """
         if "unnamed:_0" in self.df.columns:
-            self.df = self.df.drop(columns=["unnamed:_0"])
-        self.df = self.df.loc[:, ~self.df.columns.duplicated()]
+            self._replace_df(self.df.drop(columns=["unnamed:_0"]))
+        self._replace_df(self.df.loc[:, ~self.df.columns.duplicated()])
         return self.df
 
     def clean_dataframe(self):
@@ -51,59 +260,73 @@ class DataQualityUtils:
     def columns_with_significant_missing_values(
         self, threshold: float = 5.0
     ) -> pd.DataFrame:
-        missing_counts = self.df.isna().sum()
+        missing_counts = self.missing_counts
         missing_percent = (missing_counts / len(self.df)) * 100
         significant = missing_percent[missing_percent > threshold]
         return pd.DataFrame(
             {
                 "#missing_values": missing_counts[significant.index],
-                "percentage": significant.apply(lambda x: f"{x:.2f}%"),
+                "percentage": _format_percent(significant),
             }
         ).sort_values(by="#missing_values", ascending=False)
 
-    def check_duplicates(self):
+    def _duplicated(self, keep="first") -> np.ndarray:
+        """
+        DataFrame.duplicated(keep=keep) as a boolean array, cached per
+        `keep` until the DataFrame changes (only while it is owned).
+        """
+        if keep in self._duplicated_cache:
+            return self._duplicated_cache[keep]
+        mask = self.df.duplicated(keep=keep).to_numpy()
+        if self._owns_df:
+            self._duplicated_cache[keep] = mask
+        return mask
+
+    def check_duplicates(self) -> int:
         """
         Return the number of duplicate rows in the DataFrame.
+        Cached until the DataFrame changes.
         """
-        return self.df.duplicated().sum()
+        return int(self._duplicated().sum())
+
+    count_duplicates = check_duplicates
 
     def find_invalid_values(self, additional_invalids=None) -> dict:
         """
-        Identifies and summarizes invalid values in object columns.
+        Identifies and summarizes invalid values in text (object or
+        string dtype) columns.
         """
         if additional_invalids is None:
             additional_invalids = ["NA", "null", "NULL", "-", "N/A"]
 
         invalid_summary = {}
-        for col in self.df.select_dtypes(include="object").columns:
-            mask = self.df[col].astype(str).str.strip().isin(["", *additional_invalids])
-            count = mask.sum()
-            if count > 0:
-                invalid_summary[col] = {
-                    "count": count,
-                    "examples": self.df.loc[mask, col].head(5),
-                }
+        obj = self.df.select_dtypes(include=["object", "string"])
+        if obj.empty:
+            return invalid_summary
+
+        mask = _invalid_value_mask(obj, frozenset(["", *additional_invalids]))
+        counts = mask.sum(axis=0)
+
+        for j in np.flatnonzero(counts):
+            invalid_summary[obj.columns[j]] = {
+                "count": counts[j],
+                "examples": obj.iloc[mask[:, j], j].head(5),
+            }
         return invalid_summary
 
     def summary(self) -> pd.DataFrame:
         """
         Provide a concise summary of missing data in the entire DataFrame.
         """
-        missing_counts = self.df.isna().sum()
+        missing_counts = self.missing_counts
         missing_percent = (missing_counts / len(self.df)) * 100
         return pd.DataFrame(
             {
                 "#missing_values": missing_counts,
-                "percentage": missing_percent.map(lambda x: f"{x:.2f}%"),
+                "percentage": _format_percent(missing_percent),
             }
         ).sort_values(by="#missing_values", ascending=False)
 
-    def count_duplicates(self) -> int:
-        """
-        Returns the number of duplicate rows in the DataFrame.
-        """
-        return self.df.duplicated().sum()
-
     def convert_columns_to_datetime(
         self, columns: Optional[list[str]] = None, errors: str = "coerce"
     ) -> pd.DataFrame:
@@ -116,18 +339,15 @@ class DataQualityUtils:
 
         for col in columns:
             if col in self.df.columns:
-                original_non_null = self.df[col].notna().sum()
-
-                # Ensure strings and strip whitespaces
-                self.df[col] = self.df[col].astype(str).str.strip()
-
-                # Replace known bad values
-                self.df[col] = self.df[col].replace(
-                    ["", "nan", "null", "None", "NaT", "N/A"], pd.NA
-                )
+                col_data = self.df[col]
+                if is_datetime64_any_dtype(col_data):
+                    continue
+                original_non_null = col_data.notna().sum()
 
-                # Convert datetime (handles timezone-aware strings too)
-                self.df[col] = pd.to_datetime(self.df[col], errors=errors, utc=True)
+                # Convert datetime directly; blank and unparseable values
+                # become NaT, timezone-aware strings are normalized to UTC
+                self._ensure_owned()
+                self.df[col] = _to_utc_datetime(col_data, errors)
 
                 converted = self.df[col].notna().sum()
                 print(
@@ -143,9 +363,13 @@ class DataQualityUtils:
         Drops columns that are completely empty (i.e., all values are NaN).
         Returns the updated DataFrame and prints a summary of removed columns.
         """
-        empty_cols = self.df.columns[self.df.isna().all()].tolist()
+        # first_valid_index() stops at the first non-missing value per column
+        empty_cols = [
+            col for col in self.df.columns if self.df[col].first_valid_index() is None
+        ]
         if empty_cols:
             print(f"[INFO] Dropping {len(empty_cols)} empty column(s): {empty_cols}")
+            self._ensure_owned()
             self.df.drop(columns=empty_cols, inplace=True)
         else:
             print("[INFO] No completely empty columns found.")
@@ -165,6 +389,7 @@ class DataQualityUtils:
         existing_cols = [col for col in columns if col in self.df.columns]
 
         if existing_cols:
+            self._ensure_owned()
             self.df.drop(columns=existing_cols, inplace=True)
             print(f"[INFO] Dropped columns: {existing_cols}")
 
@@ -195,6 +420,7 @@ class DataQualityUtils:
             )
 
         rename_applied = {k: v for k, v in rename_map.items() if k in self.df.columns}
+        self._ensure_owned()
         self.df.rename(columns=rename_applied, inplace=True)
 
         print(f"[INFO] Renamed columns: {rename_applied}")
@@ -220,6 +446,7 @@ class DataQualityUtils:
         if missing:
             print(f"[WARNING] These columns were not found and skipped: {missing}")
         if valid_renames:
+            self._ensure_owned()
             self.df.rename(columns=valid_renames, inplace=True)
             print(f"[INFO] Renamed columns: {valid_renames}")
 
@@ -231,7 +458,7 @@ class DataQualityUtils:
         # Reorder: renamed columns first, rest in original
         # order (excluding renamed ones)
         rest = [col for col in self.df.columns if col not in renamed_columns_order]
-        self.df = self.df[renamed_columns_order + rest]
+        self._replace_df(self.df[renamed_columns_order + rest])
 
         return self.df
 
@@ -247,7 +474,7 @@ class DataQualityUtils:
         Returns:
             pd.DataFrame: DataFrame of duplicated rows.
         """
-        duplicates = self.df[self.df.duplicated(keep=keep)]
+        duplicates = self.df[self._duplicated(keep=keep)]
         print(f"[INFO] Found {len(duplicates)} duplicated row(s).")
         return duplicates
 
@@ -268,13 +495,14 @@ class DataQualityUtils:
             pd.DataFrame: Updated DataFrame with duplicates removed.
         """
         before = len(self.df)
+        unique_rows = ~self._duplicated(keep=keep)
         if inplace:
-            self.df.drop_duplicates(keep=keep, inplace=True)
+            self._replace_df(self.df[unique_rows])
             after = len(self.df)
             print(f"[INFO] Dropped {before - after} duplicate row(s).")
             return self.df
         else:
-            df_cleaned = self.df.drop_duplicates(keep=keep)
+            df_cleaned = self.df[unique_rows]
             print(
                 f"[INFO] Dropped {before - len(df_cleaned)} "
                 f"duplicate row(s) (non-inplace)."
@@ -308,10 +536,12 @@ class DataQualityUtils:
             print("[ERROR] None of the provided columns are valid. Aborting operation.")
             return self.df
 
-        before_count = len(self.df)
-        self.df.dropna(subset=columns, inplace=True)
-        after_count = len(self.df)
-        dropped = before_count - after_count
+        # One isna() pass gives both the rows to drop and the count; the
+        # frame is only rebuilt (not copied and then mutated) if rows go
+        row_drop = self.df[columns].isna().to_numpy().any(axis=1)
+        dropped = int(np.count_nonzero(row_drop))
+        if dropped:
+            self._replace_df(self.df.loc[~row_drop])
         print(
             f"[INFO] Dropped {dropped} row(s) with missing values in columns: {columns}"
         )
@@ -331,20 +561,15 @@ class DataQualityUtils:
         if text_column not in self.df.columns:
             raise ValueError(f"Column '{text_column}' not found in DataFrame.")
 
-        def is_english(text):
-            try:
-                return detect(text) == "en"
-            except LangDetectException:
-                return False
-
-        mask = self.df[text_column].astype(str).apply(is_english)
+        langs = detect_languages(self.df[text_column].astype(str).tolist())
+        mask = np.array([lang == "en" for lang in langs], dtype=bool)
         filtered_df = self.df.loc[mask].copy()
         dropped_count = len(self.df) - len(filtered_df)
         print(
             f"[INFO] Dropped {dropped_count} non-English rows "
             f"from '{text_column}' column."
         )
-        self.df = filtered_df
+        self._replace_df(filtered_df)
         return self.df
 
     def replace_emojis_with_text(
@@ -370,51 +595,85 @@ class DataQualityUtils:
 
         emoji_map_safe: Dict[str, str] = emoji_map  # Ensures mypy compliance
 
+        # One alternation for all mapped emojis, longest first so that
+        # multi-codepoint sequences win over their prefixes
+        mapped_pattern = re.compile(
+            "|".join(
+                re.escape(emj) for emj in sorted(emoji_map_safe, key=len, reverse=True)
+            )
+        )
+
+        def substitute(match: re.Match) -> str:
+            return emoji_map_safe[match.group(0)]
+
         def replace_emojis(text: Any) -> Any:
             if not isinstance(text, str):
                 return text
-            for emj, repl in emoji_map_safe.items():
-                text = text.replace(emj, repl)
-            text = emoji.replace_emoji(text, replace="")
-            text = re.sub(r"\s+", " ", text).strip()
-            return text
-
-        self.df[text_column] = self.df[text_column].apply(replace_emojis)
+            # Emojis are never ASCII, so most reviews only need whitespace cleanup
+            if not text.isascii():
+                if emoji_map_safe:
+                    text = mapped_pattern.sub(substitute, text)
+                text = emoji.replace_emoji(text, replace="")
+            return _WHITESPACE.sub(" ", text).strip()
+
+        self._ensure_owned()
+        self.df[text_column] = self.df[text_column].map(replace_emojis)
         print(
             f"[INFO] Replaced emojis with text equivalents in '{text_column}' column."
         )
         return self.df
 
     async def translate_to_english(self, text):
-        try:
-            lang = detect(text)
-        except LangDetectException:
+        lang = _detect(text)
+        if lang is None or lang == "en":
             return text
+        return await self._translate(text, lang)
 
-        if lang != "en":
-            try:
-                translated = await self.translator.translate(text, src=lang, dest="en")
-                return translated.text
-            except Exception as e:
-                print(f"[WARN] Translation failed: {e}")
-                return text
-        else:
+    async def _translate(self, text: str, lang: str) -> str:
+        """Translate text from the already detected language `lang` to English."""
+        try:
+            translated = await self.translator.translate(
+                text, src=_googletrans_src(lang), dest="en"
+            )
+            return translated.text
+        except Exception as e:
+            print(f"[WARN] Translation failed: {e}")
             return text
 
     async def translate_non_english_text(self, text_column):
         if text_column not in self.df.columns:
             raise ValueError(f"Column '{text_column}' not found in DataFrame.")
 
-        # Apply async function row-wise (needs some trick)
-        import nest_asyncio
+        texts = [str(t) for t in self.df[text_column]]
 
-        nest_asyncio.apply()
+        # Only unique, non-English texts not translated before need a
+        # request; each keeps the language found by the batch detection
+        pending = {
+            text: lang
+            for text, lang in zip(texts, detect_languages(texts))
+            if lang is not None and lang != "en" and text not in self._trans_cache
+        }
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRANSLATIONS)
 
-        async def apply_async():
-            return await asyncio.gather(
-                *[self.translate_to_english(str(t)) for t in self.df[text_column]]
-            )
+        async def translate_bounded(text, lang):
+            async with semaphore:
+                return await self._translate(text, lang)
+
+        translated = await asyncio.gather(
+            *[translate_bounded(t, lang) for t, lang in pending.items()]
+        )
+        # A result equal to its input may be a failed request; leave it
+        # out of the cache so a later call retries it
+        self._trans_cache.update(
+            (text, result)
+            for text, result in zip(pending, translated)
+            if result != text
+        )
+        print(
+            f"[INFO] Translated {len(pending)} unique non-English text(s) "
+            f"in '{text_column}' column."
+        )
 
-        translations = asyncio.run(apply_async())
-        self.df[text_column] = translations
+        self._ensure_owned()
+        self.df[text_column] = [self._trans_cache.get(text, text) for text in texts]
         return self.df
@@ -1,12 +1,65 @@
+import os
 import re
+from typing import Iterable, List, Optional
+
 import spacy
 
 nlp = spacy.load("en_core_web_sm", disable=["parser", "ner"])
 
+_PUNCTUATION = re.compile(r"[^\w\s]")
+# The ASCII characters _PUNCTUATION removes, for str.translate on ASCII text
+_ASCII_PUNCTUATION = str.maketrans(
+    "", "", "".join(c for c in map(chr, range(128)) if _PUNCTUATION.match(c))
+)
 
-def preprocess_reviews(text):
+# Docs per spaCy batch in preprocess_reviews_batch
+BATCH_SIZE = 1000
+# Below this many texts, worker start-up costs more than it saves
+MULTIPROCESS_MIN_TEXTS = 10_000
+
+
+def _normalize(text) -> str:
     text = str(text).lower()
-    text = re.sub(r"[^\w\s]", "", text)
-    doc = nlp(text)
-    tokens = [token.lemma_ for token in doc if not token.is_stop]
-    return " ".join(tokens)
+    # Most reviews are plain ASCII, where a translate table beats the regex
+    if text.isascii():
+        return text.translate(_ASCII_PUNCTUATION)
+    return _PUNCTUATION.sub("", text)
+
+
+def _lemmas_without_stopwords(doc) -> str:
+    return " ".join(token.lemma_ for token in doc if not token.is_stop)
+
+
+def preprocess_reviews(text):
+    doc = nlp(_normalize(text))
+    return _lemmas_without_stopwords(doc)
+
+
+def preprocess_reviews_batch(
+    texts: Iterable, batch_size: int = BATCH_SIZE, n_process: Optional[int] = None
+) -> List[str]:
+    """
+    Batched equivalent of preprocess_reviews, streaming each distinct text
+    through nlp.pipe once.
+
+    Args:
+        texts: Review texts; non-strings are converted with str() like
+            preprocess_reviews does.
+        batch_size (int): Number of docs spaCy processes per batch.
+        n_process (int, optional): Worker processes. Defaults to all CPUs
+            for large inputs and 1 otherwise.
+
+    Returns:
+        List[str]: Cleaned text for each input, in order.
+    """
+    normalized = [_normalize(text) for text in texts]
+    # Repeated reviews are parsed once
+    unique = list(dict.fromkeys(normalized))
+    if n_process is None:
+        n_process = (
+            (os.cpu_count() or 1) if len(unique) >= MULTIPROCESS_MIN_TEXTS else 1
+        )
+
+    docs = nlp.pipe(unique, batch_size=batch_size, n_process=n_process)
+    cleaned = {text: _lemmas_without_stopwords(doc) for text, doc in zip(unique, docs)}
+    return [cleaned[text] for text in normalized]
@@ -1,28 +1,99 @@
+from typing import List, Tuple
+
+import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 
+from features.theme_clustering import theme_bitmask, themes_from_bitmask
 
-def extract_keywords(texts, top_k=5):
-    # Clean out empty or meaningless documents
-    cleaned_texts = [text for text in texts if isinstance(text, str) and text.strip()]
+_NO_FEATURES = np.empty(0, dtype=np.intp)
+
+
+def _is_meaningful(text) -> bool:
+    return isinstance(text, str) and bool(text.strip())
+
+
+def _top_feature_indices(tfidf_matrix, top_k: int) -> List[np.ndarray]:
+    """
+    Indices of each row's top_k features, best first, for all rows at once.
+
+    Only non-zero entries are ranked, read straight from the CSR buffers
+    instead of densifying every row. A single lexsort over all entries
+    orders them by row, then score, then feature index (ties go to the
+    higher index, as with the previous dense argsort()[::-1]).
+    """
+    indptr, indices, data = tfidf_matrix.indptr, tfidf_matrix.indices, tfidf_matrix.data
+    row_lengths = np.diff(indptr)
+    row_ids = np.repeat(np.arange(len(row_lengths)), row_lengths)
+    ranked = indices[np.lexsort((-indices, -data, row_ids))]
+
+    if top_k > 0:
+        # Rows stay contiguous after the sort, so an entry's rank within its
+        # row is its offset from the row start
+        rank = np.arange(len(ranked)) - indptr[row_ids]
+        ranked = ranked[rank < top_k]
+        row_lengths = np.minimum(row_lengths, top_k)
+    return np.split(ranked, np.cumsum(row_lengths)[:-1])
 
+
+def _top_features_per_text(texts, top_k) -> Tuple[List[np.ndarray], np.ndarray]:
+    """
+    Fit TF-IDF on the meaningful texts and return, for every input text,
+    the indices of its top_k features (best first), plus the feature names.
+    Empty or meaningless texts get no features.
+    """
+    # Clean out empty or meaningless documents
+    cleaned_texts = [text for text in texts if _is_meaningful(text)]
     if not cleaned_texts:
-        return [[] for _ in texts]  # return empty keyword list for each original input
+        return [_NO_FEATURES] * len(texts), np.empty(0, dtype=object)
 
     vectorizer = TfidfVectorizer(ngram_range=(1, 2), max_features=1000)
-    tfidf_matrix = vectorizer.fit_transform(cleaned_texts)
+    tfidf_matrix = vectorizer.fit_transform(cleaned_texts).tocsr()
     feature_names = vectorizer.get_feature_names_out()
 
-    keywords_list = []
-    cleaned_index = 0
+    rows = iter(_top_feature_indices(tfidf_matrix, top_k))
+    top_features = [
+        next(rows) if _is_meaningful(text) else _NO_FEATURES for text in texts
+    ]
+    return top_features, feature_names
+
+
+def extract_keywords(texts, top_k=5):
+    top_features, feature_names = _top_features_per_text(texts, top_k)
+    return [feature_names[top].tolist() for top in top_features]
+
+
+def extract_keywords_and_themes(
+    texts, top_k=5
+) -> Tuple[List[List[str]], List[List[str]]]:
+    """
+    Extract keywords and assign themes in one pass over the TF-IDF matrix.
+
+    Equivalent to extract_keywords followed by assign_themes on each row, but
+    themes are matched once per vocabulary feature into a bitmask; each
+    row's themes are then the OR of its top features' masks, computed for
+    all rows with one gather and one reduceat.
+
+    Returns:
+        Tuple of (keywords per text, themes per text).
+    """
+    top_features, feature_names = _top_features_per_text(texts, top_k)
+    keywords_list = [feature_names[top].tolist() for top in top_features]
 
-    for original in texts:
-        if not isinstance(original, str) or not original.strip():
-            keywords_list.append([])
-        else:
-            row_data = tfidf_matrix[cleaned_index].toarray().flatten()
-            top_indices = row_data.argsort()[-top_k:][::-1]
-            keywords = [feature_names[i] for i in top_indices if row_data[i] > 0]
-            keywords_list.append(keywords)
-            cleaned_index += 1
+    feature_masks = np.array(
+        [theme_bitmask(name) for name in feature_names], dtype=np.uint64
+    )
+    row_lengths = np.array([len(top) for top in top_features])
+    row_masks = np.zeros(len(top_features), dtype=np.uint64)
+    has_features = row_lengths > 0
+    if has_features.any():
+        # Empty rows hold no entries, so the non-empty rows' start offsets
+        # alone delimit every row's slice of the concatenated indices
+        starts = np.cumsum(row_lengths) - row_lengths
+        row_masks[has_features] = np.bitwise_or.reduceat(
+            feature_masks[np.concatenate(top_features)], starts[has_features]
+        )
 
-    return keywords_list
+    # Few distinct theme combinations occur, so decode each mask once
+    decoded = {mask: themes_from_bitmask(mask) for mask in set(row_masks.tolist())}
+    themes_list = [list(decoded[mask]) for mask in row_masks.tolist()]
+    return keywords_list, themes_list
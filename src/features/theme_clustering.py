@@ -1,11 +1,71 @@
 # src/features/theme_assignment.py
 
-from typing import List
 import logging
+import re
+from typing import List, Set
 
 logger = logging.getLogger(__name__)
 
 
+KEYWORD_THEME_MAP = {
+    "login": "Account Access Issues",
+    "password": "Account Access Issues",
+    "crash": "Reliability",
+    "slow": "Transaction Performance",
+    "support": "Customer Support",
+    "interface": "User Experience",
+    "design": "User Experience",
+    "feature": "Feature Requests",
+    "update": "Feature Requests",
+}
+
+# All theme keys in one pattern; the lookahead reports overlapping matches too
+_THEME_KEY_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(key) for key in KEYWORD_THEME_MAP) + "))"
+)
+
+# Joins a row's keywords for a single scan; never occurs inside a theme key
+_KEYWORD_SEPARATOR = "\x00"
+
+# Theme assigned when no keyword matches
+DEFAULT_THEME = "Miscellaneous"
+
+# Bit i of a theme bitmask stands for THEMES[i]; sorted, so decoding a
+# mask in bit order yields themes in assign_themes' output order
+THEMES = sorted(set(KEYWORD_THEME_MAP.values()))
+_THEME_BITS = {theme: 1 << bit for bit, theme in enumerate(THEMES)}
+
+
+def match_themes(text: str) -> Set[str]:
+    """
+    Return the themes whose keys occur (case-insensitively) in text.
+    """
+    return {
+        KEYWORD_THEME_MAP[match.group(1)]
+        for match in _THEME_KEY_PATTERN.finditer(text.lower())
+    }
+
+
+def theme_bitmask(text: str) -> int:
+    """
+    Return match_themes(text) encoded as a bitmask over THEMES.
+    """
+    mask = 0
+    for theme in match_themes(text):
+        mask |= _THEME_BITS[theme]
+    return mask
+
+
+def themes_from_bitmask(mask: int) -> List[str]:
+    """
+    Decode a bitmask over THEMES into assign_themes' output: the sorted
+    matched themes, or ['Miscellaneous'] for an empty mask.
+    """
+    if not mask:
+        return [DEFAULT_THEME]
+    return [theme for theme, bit in _THEME_BITS.items() if mask & bit]
+
+
 def assign_themes(keywords: List[str]) -> List[str]:
     """
     Assigns user-provided keywords to pre-defined themes using substring matching.
@@ -17,28 +77,12 @@ def assign_themes(keywords: List[str]) -> List[str]:
         List[str]: A list of unique themes matched from the keywords,
                    or ['Miscellaneous'] if no match is found.
     """
-    keyword_theme_map = {
-        "login": "Account Access Issues",
-        "password": "Account Access Issues",
-        "crash": "Reliability",
-        "slow": "Transaction Performance",
-        "support": "Customer Support",
-        "interface": "User Experience",
-        "design": "User Experience",
-        "feature": "Feature Requests",
-        "update": "Feature Requests",
-    }
-
-    assigned_themes = set()
-    for kw in keywords:
-        kw_lower = kw.lower()
-        for key, theme in keyword_theme_map.items():
-            if key in kw_lower:
-                assigned_themes.add(theme)
-                logger.debug(f"Matched '{kw}' to theme '{theme}'")
+    assigned_themes = match_themes(_KEYWORD_SEPARATOR.join(keywords))
 
     if not assigned_themes:
         logger.debug("No matches found. Assigning theme: 'Miscellaneous'")
-        return ["Miscellaneous"]
+        return [DEFAULT_THEME]
 
-    return sorted(assigned_themes)
+    themes = sorted(assigned_themes)
+    logger.debug("Matched %s to themes %s", keywords, themes)
+    return themes
@@ -1,50 +1,147 @@
 # src/features/sentiment_analysis.py
 
-from transformers import pipeline
-from typing import Tuple, Union
+import functools
+
+import torch
+from transformers import (
+    AutoModelForSequenceClassification,
+    AutoTokenizer,
+    pipeline,
+)
+from typing import List, Optional, Tuple, Union
 import logging
 
+from analytics.path_config import MODELS_DIR
+
+try:
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+except ImportError:  # optional: fall back to quantized PyTorch on CPU
+    ORTModelForSequenceClassification = None
+
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
-# Load model once at module level for performance
-try:
-    sentiment_pipeline = pipeline(
-        "sentiment-analysis", model="distilbert-base-uncased-finetuned-sst-2-english"
+# BERT models have a 512 token limit
+MAX_TOKENS = 512
+# Texts per forward pass in analyze_sentiment_batch
+SENTIMENT_BATCH_SIZE = 64
+
+MODEL_NAME = "distilbert-base-uncased-finetuned-sst-2-english"
+
+# ONNX export of MODEL_NAME with int8 weights, built on first use
+ONNX_MODEL_DIR = MODELS_DIR / "distilbert-sst2-onnx"
+ONNX_MODEL_FILE = "model_quantized.onnx"
+
+
+def _load_onnx_model():
+    """
+    Load the int8 ONNX Runtime model, exporting and quantizing MODEL_NAME
+    into ONNX_MODEL_DIR the first time so later runs skip the export.
+    """
+    if not (ONNX_MODEL_DIR / ONNX_MODEL_FILE).exists():
+        model = ORTModelForSequenceClassification.from_pretrained(
+            MODEL_NAME, export=True
+        )
+        model.save_pretrained(ONNX_MODEL_DIR)
+        quantizer = ORTQuantizer.from_pretrained(model)
+        quantizer.quantize(
+            save_dir=ONNX_MODEL_DIR,
+            quantization_config=AutoQuantizationConfig.avx512_vnni(
+                is_static=False, per_channel=False
+            ),
+        )
+    return ORTModelForSequenceClassification.from_pretrained(
+        ONNX_MODEL_DIR, file_name=ONNX_MODEL_FILE, provider="CPUExecutionProvider"
     )
-    logger.info("Sentiment pipeline loaded successfully.")
-except Exception as e:
-    logger.error("Failed to load sentiment pipeline: %s", str(e))
-    sentiment_pipeline = None
 
 
-def analyze_sentiment(text: str) -> Tuple[str, float]:
+def _load_sentiment_pipeline():
+    """
+    Build the sentiment pipeline. On GPU the model runs in half precision
+    (bfloat16 where supported, else float16) so matmuls use tensor cores.
+    On CPU an int8 ONNX Runtime model (fused graph, oneDNN kernels) is used
+    when optimum is installed; otherwise the PyTorch model's Linear layers
+    are dynamically quantized to int8. Both speed up inference severalfold
+    with negligible accuracy loss on SST-2. If the ONNX export or the
+    quantization fails, the plain fp32 PyTorch model is used instead.
+    """
+    tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
+
+    if torch.cuda.is_available():
+        dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        model = AutoModelForSequenceClassification.from_pretrained(
+            MODEL_NAME, torch_dtype=dtype
+        )
+        model.eval()
+        return pipeline(
+            "sentiment-analysis", model=model, tokenizer=tokenizer, device=0
+        )
+
+    if ORTModelForSequenceClassification is not None:
+        try:
+            return pipeline(
+                "sentiment-analysis", model=_load_onnx_model(), tokenizer=tokenizer
+            )
+        except Exception as e:
+            logger.warning("ONNX Runtime model unavailable, using PyTorch: %s", e)
+
+    model = AutoModelForSequenceClassification.from_pretrained(MODEL_NAME)
+    model.eval()
+    try:
+        model = torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    except Exception as e:  # e.g. no fbgemm/qnnpack engine in this build
+        logger.warning("int8 quantization unavailable, using fp32 model: %s", e)
+    return pipeline("sentiment-analysis", model=model, tokenizer=tokenizer, device=-1)
+
+
+@functools.lru_cache(maxsize=1)
+def get_sentiment_pipeline():
+    """
+    Return the sentiment pipeline, loading it on first use only. A failed
+    load is logged and cached as None, so it is not retried on every call.
+    """
+    try:
+        sentiment_pipeline = _load_sentiment_pipeline()
+        logger.info("Sentiment pipeline loaded successfully.")
+        return sentiment_pipeline
+    except Exception as e:
+        logger.error("Failed to load sentiment pipeline: %s", str(e))
+        return None
+
+
+def analyze_sentiment(
+    text: Union[str, List[str]],
+) -> Union[Tuple[str, float], List[Tuple[str, float]]]:
     """
     Analyze sentiment of the input text using a pre-trained BERT model.
 
     Args:
-        text (str): Input text string.
+        text (str or list of str): Input text string, or several strings to
+            score together in batched forward passes.
 
     Returns:
         Tuple[str, float]: Sentiment label ("positive" or "negative")
-        and confidence score.
+        and confidence score; a list of them, in order, for list input.
 
     Raises:
-        ValueError: If text is invalid or pipeline is not loaded.
+        ValueError: If text (or any list entry) is invalid.
+        RuntimeError: If the pipeline is not loaded.
     """
-    if not isinstance(text, str) or not text.strip():
+    texts = text if isinstance(text, list) else [text]
+    if not all(isinstance(t, str) and t.strip() for t in texts):
         raise ValueError("Input text must be a non-empty string.")
 
+    sentiment_pipeline = get_sentiment_pipeline()
     if sentiment_pipeline is None:
         raise RuntimeError("Sentiment analysis model not loaded properly.")
 
-    truncated_text = text[:512]  # BERT models have a 512 token limit
-    result = sentiment_pipeline(truncated_text)[0]
-    label = result["label"].lower()
-    score = result["score"]
-
-    logger.debug(f"Sentiment analysis result: {label} ({score:.2f})")
-    return label, score
+    results = _score_texts(sentiment_pipeline, texts, SENTIMENT_BATCH_SIZE)
+    for label, score in results:
+        logger.debug(f"Sentiment analysis result: {label} ({score:.2f})")
+    return results if isinstance(text, list) else results[0]
 
 
 def safe_analyze_sentiment(text: Union[str, None]) -> Tuple[str, float]:
@@ -68,3 +165,79 @@ def safe_analyze_sentiment(text: Union[str, None]) -> Tuple[str, float]:
             f"Skipping invalid input during sentiment analysis: {text!r} ({e})"
         )
         return "neutral", 0.0
+
+
+def analyze_sentiment_batch(
+    texts: List[Optional[str]], batch_size: int = SENTIMENT_BATCH_SIZE
+) -> List[Tuple[str, float]]:
+    """
+    Analyze sentiment for many texts with batched forward passes, scoring
+    each distinct text once.
+
+    Invalid entries (None, non-strings, blank strings) get the same neutral
+    fallback as safe_analyze_sentiment, as does every entry if the model is
+    not loaded.
+
+    Args:
+        texts (list of str or None): Input texts.
+        batch_size (int): Number of texts per forward pass.
+
+    Returns:
+        List[Tuple[str, float]]: One (label, score) pair per input text.
+    """
+    results: List[Tuple[str, float]] = [("neutral", 0.0)] * len(texts)
+    valid_idx = [
+        i for i, text in enumerate(texts) if isinstance(text, str) and text.strip()
+    ]
+    if len(valid_idx) < len(texts):
+        logger.warning(
+            f"Skipping {len(texts) - len(valid_idx)} invalid input(s) "
+            "during sentiment analysis"
+        )
+    if not valid_idx:
+        return results
+
+    sentiment_pipeline = get_sentiment_pipeline()
+    if sentiment_pipeline is None:
+        logger.error("Sentiment analysis model not loaded properly.")
+        return results
+
+    # Repeated reviews ("Great app!") are scored once
+    unique_texts = list(dict.fromkeys(texts[i] for i in valid_idx))
+    by_text = dict(
+        zip(unique_texts, _score_texts(sentiment_pipeline, unique_texts, batch_size))
+    )
+    for i in valid_idx:
+        results[i] = by_text[texts[i]]
+    return results
+
+
+def _score_texts(
+    sentiment_pipeline, texts: List[str], batch_size: int
+) -> List[Tuple[str, float]]:
+    """
+    Run the pipeline's tokenizer and model directly, bypassing its per-item
+    pre/post-processing. All texts are tokenized (and truncated) in one fast
+    tokenizer call; batches are formed from texts of similar token length
+    so little padding is computed.
+    """
+    tokenizer = sentiment_pipeline.tokenizer
+    model = sentiment_pipeline.model
+    id2label = model.config.id2label
+
+    encoded = tokenizer(texts, truncation=True, max_length=MAX_TOKENS)
+    by_length = sorted(range(len(texts)), key=lambda i: len(encoded["input_ids"][i]))
+
+    scored: List[Tuple[str, float]] = [("neutral", 0.0)] * len(texts)
+    with torch.inference_mode():
+        for start in range(0, len(by_length), batch_size):
+            batch_idx = by_length[start : start + batch_size]
+            batch = tokenizer.pad(
+                {key: [encoded[key][i] for i in batch_idx] for key in encoded},
+                return_tensors="pt",
+            ).to(sentiment_pipeline.device)
+            probs = model(**batch).logits.float().softmax(dim=-1)
+            scores, labels = probs.max(dim=-1)
+            for i, label, score in zip(batch_idx, labels.tolist(), scores.tolist()):
+                scored[i] = (id2label[label].lower(), score)
+    return scored
@@ -1,42 +1,78 @@
+import json
+
 import pandas as pd
 from pathlib import Path
 
-from data.text_cleaning import preprocess_reviews
-from models.sentiment_model import safe_analyze_sentiment
-from features.keyword_extraction import extract_keywords
-from features.theme_clustering import assign_themes
+from data.text_cleaning import preprocess_reviews_batch
+from models.sentiment_model import analyze_sentiment_batch
+from features.keyword_extraction import extract_keywords_and_themes
 from data.data_quality_utils import DataQualityUtils
 
+# Reviews read, cleaned and scored at a time in run_pipeline
+CHUNK_SIZE = 50_000
 
-def run_pipeline(input_csv: str, output_csv: str):
-    """Orchestrates the sentiment and thematic analysis pipeline."""
 
-    print("📥 Loading data...")
-    df = pd.read_csv(input_csv)
-    df.rename(columns={"review": "review_text"}, inplace=True)
-
-    print("🧹 Preprocessing review text...")
-    df["cleaned_text"] = df["review_text"].apply(preprocess_reviews)
-    df = df[df["cleaned_text"].str.strip() != ""]
-    dq = DataQualityUtils(df)
-    df = dq.replace_emojis_with_text("cleaned_text")
-
-    print("🧠 Performing sentiment analysis with DistilBERT...")
-    sentiment_results = df["cleaned_text"].apply(safe_analyze_sentiment)
-    df[["sentiment_label", "sentiment_score"]] = pd.DataFrame(
-        sentiment_results.tolist(), index=df.index
+def _clean_and_score(chunk: pd.DataFrame) -> pd.DataFrame:
+    """Clean review text and add sentiment columns for one chunk of rows."""
+    chunk = chunk.rename(columns={"review": "review_text"})
+    # Explicit dtype so an empty chunk still gets a string column
+    chunk["cleaned_text"] = pd.Series(
+        preprocess_reviews_batch(chunk["review_text"].tolist()),
+        index=chunk.index,
+        dtype=object,
     )
+    chunk = chunk[chunk["cleaned_text"].str.strip() != ""]
+    dq = DataQualityUtils(chunk)
+    chunk = dq.replace_emojis_with_text("cleaned_text")
+
+    sentiment_results = analyze_sentiment_batch(chunk["cleaned_text"].tolist())
+    chunk[["sentiment_label", "sentiment_score"]] = pd.DataFrame(
+        sentiment_results, index=chunk.index, columns=["label", "score"]
+    )
+    return chunk
+
 
-    print("🔍 Extracting keywords...")
-    df["keywords"] = extract_keywords(df["cleaned_text"].tolist(), top_k=5)
+def run_pipeline(input_csv: str, output_csv: str, chunk_size: int = CHUNK_SIZE):
+    """
+    Orchestrates the sentiment and thematic analysis pipeline.
 
-    print("🧩 Assigning themes based on keyword clustering...")
-    df["themes"] = df["keywords"].apply(assign_themes)
+    Cleaning and sentiment run on chunks of `chunk_size` rows, so each
+    batch's tokenized text and model outputs are held for one chunk at a
+    time. The scored chunks are all kept and joined, since keywords are
+    extracted once over all cleaned reviews (TF-IDF weights depend on the
+    whole corpus); memory therefore still grows with the input size.
+    Results are written as Parquet if `output_csv` ends in ".parquet" and
+    as CSV otherwise.
+    """
+
+    print("📥 Loading data...")
+    print("🧹 Preprocessing review text and 🧠 analysing sentiment with DistilBERT...")
+    chunks = [
+        _clean_and_score(chunk)
+        for chunk in pd.read_csv(input_csv, chunksize=chunk_size)
+    ]
+    if not chunks:
+        # No rows to chunk: run the empty header through so the output
+        # still has every column
+        chunks = [_clean_and_score(pd.read_csv(input_csv, nrows=0))]
+    df = pd.concat(chunks, ignore_index=True)
+
+    print("🔍 Extracting keywords and assigning themes...")
+    df["keywords"], df["themes"] = extract_keywords_and_themes(
+        df["cleaned_text"].tolist(), top_k=5
+    )
 
     print("💾 Saving results...")
     output_path = Path(output_csv)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_csv, index=False)
+    if output_path.suffix == ".parquet":
+        df.to_parquet(output_path, index=False, compression="zstd")
+    else:
+        # Store list columns as JSON so readers can parse them without eval
+        df.assign(
+            keywords=df["keywords"].map(json.dumps),
+            themes=df["themes"].map(json.dumps),
+        ).to_csv(output_path, index=False)
 
     print(f"✅ Pipeline completed. Results saved to {output_csv}")
 
@@ -1,9 +1,29 @@
+import ast
+import hashlib
+import json
+import os
+from collections import Counter
+from itertools import chain
+
+import numpy as np
 import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
 from wordcloud import WordCloud
 import logging
-from typing import Optional
+from typing import Dict, List, Optional
+
+from analytics.path_config import DATA_DIR
+
+try:
+    import pyarrow  # noqa: F401  (enables the Parquet load cache)
+except ImportError:  # optional: always load from CSV
+    pyarrow = None
+
+# Rendered word clouds, keyed by a hash of their frequencies and size
+WORDCLOUD_CACHE_DIR = DATA_DIR / "interim" / "wordcloud_cache"
+# Parsed review files for load_reviews, keyed by a hash of the CSV path
+REVIEWS_CACHE_DIR = DATA_DIR / "interim" / "reviews_cache"
 
 # Configure logging
 logging.basicConfig(
@@ -11,6 +31,94 @@ logging.basicConfig(
 )
 
 
+def parse_list_column(values: pd.Series) -> List[list]:
+    """
+    Parse a column of stringified lists, e.g. keywords or themes read back
+    from CSV. JSON ('["a", "b"]') is tried first and Python list literals
+    ("['a', 'b']", as older outputs store them) are parsed safely with
+    ast.literal_eval; nothing is executed. Each distinct string is parsed
+    once, and missing values become empty lists.
+    """
+
+    def parse(raw: str) -> list:
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            return ast.literal_eval(raw)
+
+    values = values.to_numpy()
+    parsed = {raw: parse(raw) for raw in pd.unique(values) if isinstance(raw, str)}
+    return [parsed[raw] if isinstance(raw, str) else [] for raw in values]
+
+
+def _load_reviews_csv(filepath: str) -> pd.DataFrame:
+    df = pd.read_csv(filepath)
+    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    df["themes"] = parse_list_column(df["themes"])
+    df["keywords"] = parse_list_column(df["keywords"])
+    return df
+
+
+def load_reviews(filepath: str) -> pd.DataFrame:
+    """
+    Load processed reviews with parsed dates and keyword/theme lists.
+
+    With pyarrow installed, the parsed frame is cached as Parquet under
+    REVIEWS_CACHE_DIR and reused while it is newer than the CSV, so repeat
+    loads skip CSV parsing, date coercion and list parsing. Frames Arrow
+    cannot store (e.g. mixed-type columns) are simply not cached.
+    """
+    if pyarrow is None:
+        return _load_reviews_csv(filepath)
+
+    path = os.path.abspath(filepath)
+    key = hashlib.blake2b(path.encode(), digest_size=8).hexdigest()
+    cache = REVIEWS_CACHE_DIR / f"{os.path.basename(path)}-{key}.parquet"
+    if cache.exists() and os.path.getmtime(cache) >= os.path.getmtime(path):
+        df = pd.read_parquet(cache)
+        # Arrow list columns come back as numpy arrays
+        for col in ("themes", "keywords"):
+            df[col] = [values.tolist() for values in df[col]]
+        return df
+
+    df = _load_reviews_csv(filepath)
+    try:
+        REVIEWS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(cache, engine="pyarrow", index=False)
+    except (OSError, pyarrow.ArrowInvalid, pyarrow.ArrowTypeError) as e:
+        logging.warning("Could not write load cache %s: %s", cache, e)
+        cache.unlink(missing_ok=True)
+    return df
+
+
+def render_wordcloud(
+    frequencies: Dict[str, int], width: int = 800, height: int = 400
+) -> np.ndarray:
+    """
+    Render a word cloud to an RGB array, reusing a copy cached on disk
+    when the same frequencies were rendered at the same size before.
+    WordCloud's word placement is the slow part, and it only depends on
+    these inputs.
+    """
+    key = hashlib.blake2b(
+        repr((width, height, sorted(frequencies.items()))).encode(), digest_size=16
+    ).hexdigest()
+    cache_path = WORDCLOUD_CACHE_DIR / f"{key}.npy"
+    if cache_path.exists():
+        return np.load(cache_path)
+
+    image = WordCloud(
+        width=width, height=height, background_color="white"
+    ).generate_from_frequencies(frequencies)
+    array = image.to_array()
+    try:
+        WORDCLOUD_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        np.save(cache_path, array)
+    except OSError as e:
+        logging.warning("Could not cache word cloud %s: %s", cache_path, e)
+    return array
+
+
 class SentimentThemeVisualizer:
     """
     A class for generating sentiment and thematic analysis visualizations.
@@ -27,10 +135,7 @@ class SentimentThemeVisualizer:
             filepath (str): Path to the CSV file.
         """
         try:
-            self.df = pd.read_csv(filepath)
-            self.df["date"] = pd.to_datetime(self.df["date"], errors="coerce")
-            self.df["themes"] = self.df["themes"].apply(eval)
-            self.df["keywords"] = self.df["keywords"].apply(eval)
+            self.df = load_reviews(filepath)
             logging.info("Data loaded successfully from %s", filepath)
         except Exception as e:
             logging.error("Failed to load or parse data: %s", e)
@@ -38,76 +143,107 @@ class SentimentThemeVisualizer:
 
     def plot_sentiment_distribution(self):
         """Plot the overall sentiment distribution."""
+        fig, ax = plt.subplots()
         try:
-            sns.countplot(data=self.df, x="sentiment_label", palette="coolwarm")
-            plt.title("Sentiment Distribution")
-            plt.xlabel("Sentiment")
-            plt.ylabel("Count")
+            sns.countplot(data=self.df, x="sentiment_label", palette="coolwarm", ax=ax)
+            ax.set_title("Sentiment Distribution")
+            ax.set_xlabel("Sentiment")
+            ax.set_ylabel("Count")
             plt.show()
         except Exception as e:
             logging.error("Error plotting sentiment distribution: %s", e)
+        finally:
+            plt.close(fig)
 
     def plot_sentiment_by_bank(self):
         """Plot sentiment distribution by bank."""
+        fig, ax = plt.subplots()
         try:
             sns.countplot(
-                data=self.df, x="bank", hue="sentiment_label", palette="coolwarm"
+                data=self.df,
+                x="bank",
+                hue="sentiment_label",
+                palette="coolwarm",
+                ax=ax,
             )
-            plt.title("Sentiment per Bank")
-            plt.xlabel("Bank")
-            plt.ylabel("Count")
-            plt.legend(title="Sentiment")
+            ax.set_title("Sentiment per Bank")
+            ax.set_xlabel("Bank")
+            ax.set_ylabel("Count")
+            ax.legend(title="Sentiment")
             plt.show()
         except Exception as e:
             logging.error("Error plotting sentiment by bank: %s", e)
+        finally:
+            plt.close(fig)
 
     def plot_theme_distribution(self):
         """Plot overall distribution of themes."""
+        fig, ax = plt.subplots()
         try:
-            theme_exploded = self.df.explode("themes")
-            sns.countplot(
-                data=theme_exploded,
-                y="themes",
-                order=theme_exploded["themes"].value_counts().index,
-            )
-            plt.title("Theme Distribution")
-            plt.xlabel("Count")
-            plt.ylabel("Theme")
+            counts = pd.Series(
+                list(chain.from_iterable(self.df["themes"]))
+            ).value_counts()
+            # Reversed so the most frequent theme is drawn at the top
+            ax.barh(counts.index[::-1], counts.to_numpy()[::-1])
+            ax.set_title("Theme Distribution")
+            ax.set_xlabel("Count")
+            ax.set_ylabel("Theme")
             plt.show()
         except Exception as e:
             logging.error("Error plotting theme distribution: %s", e)
+        finally:
+            plt.close(fig)
 
     def plot_theme_by_bank(self):
         """Plot theme distribution per bank."""
+        fig, ax = plt.subplots()
         try:
-            theme_exploded = self.df.explode("themes")
-            sns.countplot(data=theme_exploded, x="bank", hue="themes")
-            plt.title("Themes by Bank")
-            plt.xlabel("Bank")
-            plt.ylabel("Count")
-            plt.legend(title="Themes", bbox_to_anchor=(1.05, 1), loc="upper left")
-            plt.tight_layout()
+            themes = self.df["themes"]
+            # One (bank, theme) pair per theme occurrence, without
+            # exploding the whole frame
+            banks = np.repeat(self.df["bank"].to_numpy(), themes.map(len).to_numpy())
+            counts = pd.crosstab(
+                banks,
+                np.array(list(chain.from_iterable(themes)), dtype=object),
+                rownames=["bank"],
+                colnames=["themes"],
+            )
+            counts.plot(kind="bar", ax=ax)
+            ax.set_title("Themes by Bank")
+            ax.set_xlabel("Bank")
+            ax.set_ylabel("Count")
+            ax.legend(title="Themes", bbox_to_anchor=(1.05, 1), loc="upper left")
+            fig.tight_layout()
             plt.show()
         except Exception as e:
             logging.error("Error plotting themes by bank: %s", e)
+        finally:
+            plt.close(fig)
 
     def plot_sentiment_over_time(self):
         """Plot sentiment trends over time."""
+        fig, ax = plt.subplots()
         try:
-            sentiment_over_time = (
-                self.df.groupby(["date", "sentiment_label"])
-                .size()
-                .unstack(fill_value=0)
-            )
-            sentiment_over_time.plot(marker="o")
-            plt.title("Sentiment Trend Over Time")
-            plt.xlabel("Date")
-            plt.ylabel("Number of Reviews")
-            plt.xticks(rotation=45)
-            plt.tight_layout()
+            # Count per calendar day; value_counts is a cheaper path than
+            # groupby().size() when there are many dates
+            counts = pd.DataFrame(
+                {
+                    "date": self.df["date"].dt.floor("D"),
+                    "sentiment_label": self.df["sentiment_label"],
+                }
+            ).value_counts(sort=False)
+            sentiment_over_time = counts.unstack(fill_value=0).sort_index()
+            sentiment_over_time.plot(marker="o", ax=ax)
+            ax.set_title("Sentiment Trend Over Time")
+            ax.set_xlabel("Date")
+            ax.set_ylabel("Number of Reviews")
+            ax.tick_params(axis="x", labelrotation=45)
+            fig.tight_layout()
             plt.show()
         except Exception as e:
             logging.error("Error plotting sentiment over time: %s", e)
+        finally:
+            plt.close(fig)
 
     def generate_wordcloud(self, sentiment: Optional[str] = "positive"):
         """
@@ -117,23 +253,27 @@ class SentimentThemeVisualizer:
             sentiment (str, optional): Sentiment to filter by. Defaults to "positive".
         """
         try:
-            keywords = (
-                self.df[self.df["sentiment_label"] == sentiment]["keywords"]
-                .explode()
-                .dropna()
-                .tolist()
+            # Keywords are already tokenized, so count them directly rather
+            # than joining them into one string for WordCloud to re-split
+            selected = (self.df["sentiment_label"] == sentiment).to_numpy()
+            frequencies = Counter(
+                chain.from_iterable(self.df["keywords"].to_numpy()[selected])
             )
-            text = " ".join(keywords)
-            if not text:
+            if not frequencies:
                 logging.warning("No keywords found for sentiment: %s", sentiment)
                 return
-            wordcloud = WordCloud(
-                width=800, height=400, background_color="white"
-            ).generate(text)
-            plt.figure(figsize=(10, 5))
-            plt.imshow(wordcloud, interpolation="bilinear")
-            plt.axis("off")
-            plt.title(
+            wordcloud = render_wordcloud(frequencies)
+        except Exception as e:
+            logging.error(
+                "Error generating wordcloud for sentiment '%s': %s", sentiment, e
+            )
+            return
+
+        fig, ax = plt.subplots(figsize=(10, 5))
+        try:
+            ax.imshow(wordcloud, interpolation="bilinear")
+            ax.axis("off")
+            ax.set_title(
                 f"Top Keywords in {(sentiment or 'Unknown').capitalize()} Reviews"
             )
             plt.show()
@@ -141,3 +281,5 @@ class SentimentThemeVisualizer:
             logging.error(
                 "Error generating wordcloud for sentiment '%s': %s", sentiment, e
             )
+        finally:
+            plt.close(fig)
@@ -1,10 +1,26 @@
+import functools
 import os
+import re
+from collections import Counter
+from typing import List
 
 import matplotlib.pyplot as plt
 import pandas as pd
 import seaborn as sns
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-from wordcloud import WordCloud
+from wordcloud import STOPWORDS, WordCloud
+
+# Words as WordCloud's default tokenizer sees them (min_word_length=0)
+_WORD = re.compile(r"\w[\w']*")
+
+
+def _cloud_words(text: str) -> List[str]:
+    """
+    Lower-cased words of `text` as WordCloud.process_text filters them:
+    a trailing "'s" is stripped, and numbers and stopwords are dropped.
+    """
+    words = (word[:-2] if word.endswith("'s") else word for word in _WORD.findall(text))
+    return [word for word in words if not word.isdigit() and word not in STOPWORDS]
 
 
 class ReviewVisualizer:
@@ -54,6 +70,18 @@ class ReviewVisualizer:
         except Exception as e:
             raise RuntimeError("Failed to convert 'date' column to datetime.") from e
 
+        # Few distinct banks and 1-5 ratings: store them compactly so the
+        # grouping plots work on small integer codes
+        self.df["bank"] = self.df["bank"].astype("category")
+        self.df["rating"] = pd.to_numeric(
+            self.df["rating"], errors="coerce", downcast="integer"
+        )
+
+    @functools.cached_property
+    def _vader(self) -> SentimentIntensityAnalyzer:
+        """VADER analyzer, built (and its lexicon loaded) on first use only."""
+        return SentimentIntensityAnalyzer()
+
     def plot_rating_distribution(self):
         """Plots and saves a bar chart of rating frequencies."""
         try:
@@ -68,7 +96,14 @@ class ReviewVisualizer:
     def plot_average_rating_over_time(self):
         """Plots and saves a time series of average rating per day."""
         try:
-            avg_rating = self.df.set_index("date").resample("D")["rating"].mean()
+            # Group by day on the column itself rather than copying the frame
+            # to a date index; asfreq restores empty days as gaps, as
+            # resample("D") did
+            avg_rating = (
+                self.df.groupby(self.df["date"].dt.floor("D"))["rating"]
+                .mean()
+                .asfreq("D")
+            )
             avg_rating.plot(marker="o")
             plt.title("Average Rating Over Time")
             plt.ylabel("Rating")
@@ -90,10 +125,14 @@ class ReviewVisualizer:
     def plot_wordcloud(self):
         """Generates and saves a word cloud from the review text."""
         try:
-            text = " ".join(self.df["review"].astype(str))
+            # Count words review by review instead of joining the corpus
+            # into one string for WordCloud to tokenize
+            frequencies = Counter()
+            for review in self.df["review"].to_numpy():
+                frequencies.update(_cloud_words(str(review).lower()))
             wordcloud = WordCloud(
                 width=1000, height=500, background_color="white"
-            ).generate(text)
+            ).generate_from_frequencies(frequencies)
             plt.imshow(wordcloud, interpolation="bilinear")
             plt.axis("off")
             plt.title("Word Cloud of Reviews")
@@ -104,10 +143,14 @@ class ReviewVisualizer:
     def plot_sentiment_vs_rating(self):
         """Computes sentiment score using VADER and plots it against rating."""
         try:
-            analyzer = SentimentIntensityAnalyzer()
-            self.df["sentiment"] = self.df["review"].apply(
-                lambda x: analyzer.polarity_scores(str(x))["compound"]
-            )
+            reviews = self.df["review"].astype(str)
+            # VADER's rules (negation, boosters, caps) are per text, so the
+            # saving comes from scoring each distinct review only once
+            compound = {
+                text: self._vader.polarity_scores(text)["compound"]
+                for text in reviews.unique()
+            }
+            self.df["sentiment"] = reviews.map(compound)
             sns.boxplot(x="rating", y="sentiment", data=self.df, palette="magma")
             plt.title("Sentiment Score by Rating")
             self._save_plot("sentiment_vs_rating.png")
@@ -0,0 +1,108 @@
+from io import StringIO
+
+import pandas as pd
+import pytest
+from rich.console import Console
+
+from analytics.analyzer import ReviewAnalyzer
+
+
+@pytest.fixture
+def reviews_df():
+    return pd.DataFrame(
+        {
+            "bank_name": ["Dashen", "Dashen", "Dashen", "CBE", "CBE"],
+            "REVIEW_TEXT": ["a", "b", "c", "d", "e"],
+            "RATING": [5, 4, 1, 5, 2],
+            "SENTIMENT_LABEL": [
+                "positive",
+                "positive",
+                "negative",
+                "positive",
+                "negative",
+            ],
+            "THEMES": [
+                '["Zeta"]',
+                '["Zeta", "Alpha"]',
+                '["Alpha"]',
+                '["Beta"]',
+                '["Beta"]',
+            ],
+        }
+    )
+
+
+def test_display_keeps_count_order(reviews_df, monkeypatch):
+    out = StringIO()
+    monkeypatch.setattr(
+        "analytics.analyzer._get_console", lambda: Console(file=out, width=120)
+    )
+    ReviewAnalyzer(reviews_df).analyze_per_bank(display=True)
+
+    rendered = out.getvalue()
+    # Dashen's top driver (zeta, 2) comes before alpha; banks as analyzed
+    positions = [rendered.index(name) for name in ("zeta", "alpha", "CBE")]
+    assert positions == sorted(positions)
+
+
+THEMES = pd.Series(
+    [
+        '["Feature Requests", " Reliability "]',
+        "Account Access, ,Customer Support",
+        "[]",
+        "   ",
+        None,
+        float("nan"),
+        "Reliability",
+    ]
+)
+PARSED = [
+    ["feature requests", "reliability"],
+    ["account access", "customer support"],
+    [],
+    [],
+    [],
+    [],
+    ["reliability"],
+]
+
+
+def test_parse_themes_json_comma_and_blank_values():
+    assert [list(themes) for themes in ReviewAnalyzer._parse_themes(THEMES)] == PARSED
+
+
+def test_parse_themes_same_without_arrow(monkeypatch):
+    pytest.importorskip("pyarrow")
+    with_arrow = ReviewAnalyzer._parse_themes(THEMES)
+    monkeypatch.setattr("analytics.analyzer.pa", None)
+    without_arrow = ReviewAnalyzer._parse_themes(THEMES)
+
+    assert [list(t) for t in with_arrow] == [list(t) for t in without_arrow]
+    assert without_arrow.index.equals(THEMES.index)
+
+
+def test_summary_counts_themes_per_bank_and_sentiment(reviews_df):
+    summary = ReviewAnalyzer(reviews_df).generate_summary_df()
+    counts = {
+        (bank, sentiment, theme): count
+        for bank, sentiment, theme, count in summary.itertuples(index=False)
+    }
+    assert counts == {
+        ("CBE", "negative", "beta"): 1,
+        ("CBE", "positive", "beta"): 1,
+        ("Dashen", "negative", "alpha"): 1,
+        ("Dashen", "positive", "zeta"): 2,
+        ("Dashen", "positive", "alpha"): 1,
+    }
+
+
+def test_analyze_per_bank_dataframe_output(reviews_df):
+    records = ReviewAnalyzer(reviews_df).analyze_per_bank(
+        top_n=1, display=False, return_format="dataframe"
+    )
+    assert records.values.tolist() == [
+        ["Dashen", "positive", "zeta", 2],
+        ["Dashen", "negative", "alpha", 1],
+        ["CBE", "positive", "beta", 1],
+        ["CBE", "negative", "beta", 1],
+    ]
@@ -0,0 +1,47 @@
+import oracledb
+import pytest
+
+from analytics import connector
+
+
+@pytest.fixture
+def created_pools(monkeypatch):
+    """Replace oracledb.create_pool and start from an empty pool registry."""
+    created = []
+
+    def fake_create_pool(**kwargs):
+        created.append(kwargs)
+        return object()
+
+    monkeypatch.setattr(connector.oracledb, "create_pool", fake_create_pool)
+    monkeypatch.setattr(connector, "_pools", {})
+    return created
+
+
+def test_pool_is_shared_per_user_and_dsn(created_pools):
+    first = connector._get_pool("app", "secret", "db:1521/XEPDB1")
+    again = connector._get_pool("app", "secret", "db:1521/XEPDB1")
+    other_user = connector._get_pool("reporting", "secret", "db:1521/XEPDB1")
+    other_dsn = connector._get_pool("app", "secret", "db:1521/OTHER")
+
+    assert first is again
+    assert len({id(first), id(other_user), id(other_dsn)}) == 3
+    assert len(created_pools) == 3
+    assert created_pools[0]["user"] == "app"
+
+
+class FakeCursor:
+    arraysize = 100
+
+    def var(self, typ, arraysize):
+        return (typ, arraysize)
+
+
+def test_clob_columns_are_fetched_as_strings():
+    cursor = FakeCursor()
+    handler = connector._clob_as_string
+    assert handler(cursor, "THEMES", oracledb.DB_TYPE_CLOB, 0, 0, 0) == (
+        oracledb.DB_TYPE_LONG,
+        100,
+    )
+    assert handler(cursor, "RATING", oracledb.DB_TYPE_NUMBER, 0, 0, 0) is None
@@ -0,0 +1,23 @@
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+from PIL import Image
+
+from analytics.summarize import ReviewVisualizer
+
+
+def test_saved_figures_are_rgb_pngs(tmp_path):
+    visualizer = ReviewVisualizer(pd.DataFrame(), pd.DataFrame(), out_dir=tmp_path)
+    fig, ax = plt.subplots()
+    ax.plot([1, 2, 3])
+    path = tmp_path / "plot.png"
+    visualizer._save_figure(fig, path)
+    plt.close(fig)
+
+    with Image.open(path) as image:
+        assert image.format == "PNG"
+        assert image.mode == "RGB"
+
+    img2pdf = pytest.importorskip("img2pdf")
+    # Embedded directly: no transparency mask is built from an alpha channel
+    assert b"/SMask" not in img2pdf.convert([str(path)])
@@ -1,9 +1,12 @@
+from types import SimpleNamespace
+
 import numpy as np
 import pandas as pd
 import pytest
 
 from data.data_quality_utils import (
     DataQualityUtils,
+    detect_languages,
 )  # Adjust import to your actual module
 
 
@@ -34,6 +37,23 @@ def test_init_with_invalid_type():
         DataQualityUtils("not a dataframe")
 
 
+def test_input_dataframe_is_not_modified(sample_df):
+    dqu = DataQualityUtils(sample_df)
+    dqu.summary()
+    assert dqu.df is sample_df
+    dqu.clean_column_names()
+    dqu.drop_empty_columns()
+    assert "Join Date" in sample_df.columns
+    assert "EmptyCol" in sample_df.columns
+
+
+def test_copy_option(sample_df):
+    dqu = DataQualityUtils(sample_df, copy=True)
+    assert dqu.df is not sample_df
+    dqu.replace_emojis_with_text("Text")
+    assert sample_df.loc[0, "Text"] == "Hello 😀"
+
+
 def test_clean_column_names(sample_df):
     dqu = DataQualityUtils(sample_df)
     dqu.clean_column_names()
@@ -69,6 +89,24 @@ def test_check_duplicates(sample_df):
     assert count == 1
 
 
+def test_duplicate_count_refreshed_after_drop(sample_df):
+    dqu = DataQualityUtils(sample_df)
+    assert dqu.count_duplicates() == 1
+    dqu.drop_duplicates()
+    assert dqu.check_duplicates() == 0
+
+
+def test_duplicate_checks_match_pandas(sample_df):
+    dqu = DataQualityUtils(sample_df)
+    for keep in ("first", "last", False):
+        expected = sample_df[sample_df.duplicated(keep=keep)]
+        pd.testing.assert_frame_equal(dqu.display_duplicates(keep=keep), expected)
+    pd.testing.assert_frame_equal(
+        dqu.drop_duplicates(keep="last", inplace=False),
+        sample_df.drop_duplicates(keep="last"),
+    )
+
+
 def test_find_invalid_values(sample_df):
     df = sample_df.copy()
     df.loc[0, "Text"] = "NA"
@@ -79,12 +117,54 @@ def test_find_invalid_values(sample_df):
     assert invalids["text"]["count"] >= 1
 
 
+def test_find_invalid_values_without_pyarrow(monkeypatch):
+    df = pd.DataFrame(
+        {
+            "mixed": [1, "NA", " - ", None, 2.5],
+            "text": pd.Series(["x", "null", "", None, "ok"], dtype="string"),
+        }
+    )
+    with_arrow = DataQualityUtils(df).find_invalid_values()
+    monkeypatch.setattr("data.data_quality_utils.pa", None)
+    without_arrow = DataQualityUtils(df).find_invalid_values()
+    assert {col: info["count"] for col, info in with_arrow.items()} == {
+        "mixed": 2,
+        "text": 2,
+    }
+    assert {col: info["count"] for col, info in without_arrow.items()} == {
+        "mixed": 2,
+        "text": 2,
+    }
+
+
+def test_shared_frame_changes_are_seen(sample_df):
+    df = sample_df.copy()
+    dqu = DataQualityUtils(df)
+    assert dqu.check_duplicates() == 1
+    assert dqu.missing_counts["Age"] == 1
+
+    # The caller still holds the shared frame and may change it
+    df.loc[4, "Name"] = "Dave"
+    df.loc[0, "Age"] = np.nan
+    assert dqu.check_duplicates() == 0
+    assert dqu.missing_counts["Age"] == 2
+
+
 def test_summary(sample_df):
     dqu = DataQualityUtils(sample_df)
     dqu.clean_column_names()
     summary = dqu.summary()
     assert "#missing_values" in summary.columns
     assert "age" in summary.index
+    assert summary.loc["age", "percentage"] == "20.00%"
+
+
+def test_missing_counts_refreshed_after_modification(sample_df):
+    dqu = DataQualityUtils(sample_df)
+    assert dqu.summary().loc["Age", "#missing_values"] == 1
+    dqu.clean_column_names()
+    dqu.drop_rows_with_missing_in_columns(["age"])
+    assert dqu.summary().loc["age", "#missing_values"] == 0
 
 
 def test_convert_columns_to_datetime(sample_df):
@@ -94,6 +174,28 @@ def test_convert_columns_to_datetime(sample_df):
     assert pd.api.types.is_datetime64_any_dtype(df["join_date"])
 
 
+def test_convert_columns_to_datetime_iso_and_epoch():
+    df = pd.DataFrame(
+        {
+            "iso_date": ["2021-01-01", None, "2021-02-01T10:00:00+03:00"],
+            "epoch_time": np.array([0, 86_400, 172_800], dtype="uint64") * 10**9,
+        }
+    )
+    out = DataQualityUtils(df).convert_columns_to_datetime()
+    assert out["iso_date"].iloc[2] == pd.Timestamp("2021-02-01 07:00", tz="UTC")
+    assert out["iso_date"].isna().sum() == 1
+    assert out["epoch_time"].iloc[1] == pd.Timestamp("1970-01-02", tz="UTC")
+
+
+def test_convert_columns_to_datetime_placeholders_become_nat():
+    df = pd.DataFrame(
+        {"review_date": ["2024-01-01", "N/A", " ", "null", "None", " 2024-01-03 "]}
+    )
+    out = DataQualityUtils(df).convert_columns_to_datetime(errors="raise")
+    assert out["review_date"].isna().tolist() == [False, True, True, True, True, False]
+    assert out["review_date"].iloc[5] == pd.Timestamp("2024-01-03", tz="UTC")
+
+
 def test_drop_empty_columns(sample_df):
     dqu = DataQualityUtils(sample_df)
     dqu.clean_column_names()
@@ -168,6 +270,25 @@ def test_replace_emojis_with_text(sample_df):
     assert "happy" in replaced
 
 
+def test_detect_languages_uses_batched_model(monkeypatch):
+    class FakeModel:
+        def predict(self, texts, k=1):
+            assert all("\n" not in t for t in texts)
+            assert len(texts) == len(set(texts))
+            labels = [
+                ["__label__en"] if "English" in t else ["__label__fr"] for t in texts
+            ]
+            return labels, [[1.0]] * len(texts)
+
+    monkeypatch.setattr(
+        "data.data_quality_utils._load_language_model", lambda: FakeModel()
+    )
+    langs = detect_languages(
+        ["This is English", "", "Ceci est\nfrançais", "This is English"]
+    )
+    assert langs == ["en", None, "fr", "en"]
+
+
 @pytest.mark.asyncio
 async def test_translate_to_english():
     from data.data_quality_utils import DataQualityUtils
@@ -188,16 +309,22 @@ async def test_translate_to_english():
     assert translated_2 == "Hello"
 
 
+class FakeTranslator:
+    """Stands in for googletrans.Translator, recording each request."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def translate(self, text, src, dest):
+        self.calls.append((text, src))
+        return SimpleNamespace(text=f"<{text}>")
+
+
 @pytest.mark.asyncio
 async def test_translate_non_english_text(sample_df):
     dqu = DataQualityUtils(sample_df)
     dqu.clean_column_names()
-
-    # For this test, patch the translate_to_english to simulate translation
-    async def fake_translate(text):
-        return "translated" if text != "Hello" else text
-
-    dqu.translate_to_english = fake_translate  # monkeypatch
+    dqu.translator = FakeTranslator()
 
     df = await dqu.translate_non_english_text("text")
     assert isinstance(df, pd.DataFrame)
@@ -205,5 +332,50 @@ async def test_translate_non_english_text(sample_df):
     assert "text" in df.columns
 
 
+@pytest.mark.asyncio
+async def test_translate_non_english_text_deduplicates(monkeypatch):
+    df = pd.DataFrame({"text": ["Bonjour", "Hello", "Bonjour", "Hola"]})
+    dqu = DataQualityUtils(df)
+    languages = {"Bonjour": "fr", "Hello": "en", "Hola": "es", "Ciao": "it"}
+    monkeypatch.setattr(
+        "data.data_quality_utils.detect_languages",
+        lambda texts: [languages[t] for t in texts],
+    )
+
+    def detect_again(text):
+        raise AssertionError("language was already detected in the batch")
+
+    monkeypatch.setattr("data.data_quality_utils._detect", detect_again)
+    dqu.translator = FakeTranslator()
+
+    result = await dqu.translate_non_english_text("text")
+    # Each unique text is translated once, from its batch-detected language
+    assert sorted(dqu.translator.calls) == [("Bonjour", "fr"), ("Hola", "es")]
+    assert result["text"].tolist() == ["<Bonjour>", "Hello", "<Bonjour>", "<Hola>"]
+
+    # Repeat calls reuse cached translations instead of re-requesting them
+    dqu.translator.calls.clear()
+    dqu.df = pd.DataFrame({"text": ["Hola", "Bonjour", "Ciao"]})
+    result = await dqu.translate_non_english_text("text")
+    assert dqu.translator.calls == [("Ciao", "it")]
+    assert result["text"].tolist() == ["<Hola>", "<Bonjour>", "<Ciao>"]
+
+
+@pytest.mark.asyncio
+async def test_translate_maps_unknown_language_codes_to_auto(monkeypatch):
+    df = pd.DataFrame({"text": ["Bonjour", "侬好"]})
+    dqu = DataQualityUtils(df)
+    # "wuu" (Wu Chinese) is a fastText code googletrans does not accept
+    monkeypatch.setattr(
+        "data.data_quality_utils.detect_languages",
+        lambda texts: ["fr" if t == "Bonjour" else "wuu" for t in texts],
+    )
+    dqu.translator = FakeTranslator()
+
+    result = await dqu.translate_non_english_text("text")
+    assert sorted(dqu.translator.calls) == [("Bonjour", "fr"), ("侬好", "auto")]
+    assert result["text"].tolist() == ["<Bonjour>", "<侬好>"]
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -8,6 +8,7 @@ import pytest
 from data.collect_reviews import (
     PlayStoreReviewScraper,
     ReviewPreprocessor,
+    _write_csv,
     scrape_all_banks,
 )
 
@@ -44,6 +45,29 @@ def sample_raw_df():
     )
 
 
+@patch("data.collect_reviews.reviews")
+def test_fetch_reviews_pages_with_different_fields(mock_reviews):
+    page_with_reply = (
+        [
+            {
+                "content": "Fixed now",
+                "score": 4,
+                "at": "2024-01-04T12:00:00Z",
+                "replyContent": "Thanks!",
+            },
+        ],
+        None,
+    )
+    mock_reviews.side_effect = [MOCK_PAGE_1, page_with_reply]
+
+    scraper = PlayStoreReviewScraper("com.example.app", "TestBank", max_reviews=5)
+    df = scraper.fetch_reviews()
+
+    assert len(df) == 3
+    assert df["replyContent"].tolist() == [None, None, "Thanks!"]
+    assert df["content"].tolist() == ["Awesome app!", "Needs work", "Fixed now"]
+
+
 @patch("data.collect_reviews.reviews")
 def test_fetch_reviews_with_pagination(mock_reviews):
     # Simulate two pages
@@ -93,8 +117,8 @@ def test_clean_reviews_removes_duplicates_and_nulls(sample_raw_df):
 
 
 @patch("data.collect_reviews.PlayStoreReviewScraper")
-@patch("data.collect_reviews.pd.DataFrame.to_csv")
-def test_scrape_all_banks_saves_cleaned_and_combined(mock_to_csv, mock_scraper_cls):
+@patch("data.collect_reviews._write_csv")
+def test_scrape_all_banks_saves_cleaned_and_combined(mock_write_csv, mock_scraper_cls):
     # Setup mock scraper
     mock_scraper = MagicMock()
     mock_scraper.fetch_reviews.return_value = pd.DataFrame(
@@ -111,12 +135,43 @@ def test_scrape_all_banks_saves_cleaned_and_combined(mock_to_csv, mock_scraper_c
         # Check scraper was created
         mock_scraper_cls.assert_called_once_with("com.example.app", "TestBank", 5)
 
-        # Check if to_csv was called for:
+        # Check if a CSV was written for:
         # - raw file
         # - cleaned per bank
         # - final combined dataset
-        assert mock_to_csv.call_count == 3
-        saved_paths = [args[0] for args, _ in mock_to_csv.call_args_list]
+        assert mock_write_csv.call_count == 3
+        saved_paths = [args[1] for args, _ in mock_write_csv.call_args_list]
         assert any("raw" in path for path in saved_paths)
         assert any("processed" in path for path in saved_paths)
         assert output_path in saved_paths
+
+
+def test_write_csv_round_trip(sample_raw_df):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "reviews.csv")
+        _write_csv(sample_raw_df, path)
+        loaded = pd.read_csv(path)
+
+    assert list(loaded.columns) == list(sample_raw_df.columns)
+    assert len(loaded) == len(sample_raw_df)
+    assert loaded["content"].iloc[0] == "Great!"
+
+
+def test_write_csv_values_match_pandas():
+    df = pd.DataFrame(
+        {
+            "content": ["Great!", "Slow, crashes"],
+            "score": [5.0, None],
+            "at": pd.to_datetime(["2024-01-01 10:00:00", None]),
+            "edited": [True, False],
+            "replied": [None, True],
+        }
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "reviews.csv")
+        _write_csv(df, path)
+        with open(path) as f:
+            written = f.read().replace('"', "")
+
+    # Only quoting may differ from DataFrame.to_csv
+    assert written == df.to_csv(index=False).replace('"', "")
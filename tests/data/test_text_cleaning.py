@@ -1,5 +1,5 @@
 import pytest
-from data.text_cleaning import preprocess_reviews
+from data.text_cleaning import preprocess_reviews, preprocess_reviews_batch
 
 
 class TestPreprocessReviews:
@@ -38,3 +38,8 @@ class TestPreprocessReviews:
         assert "is" not in result
         assert "example" in result
         assert "sentence" in result
+
+    def test_preprocess_reviews_batch_matches_single(self):
+        """Batched cleaning gives the same output as the per-text function."""
+        texts = ["Best Mobile Banking App EVER!", None, "", "dedeb", 1234, "dedeb"]
+        assert preprocess_reviews_batch(texts) == [preprocess_reviews(t) for t in texts]
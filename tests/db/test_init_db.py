@@ -0,0 +1,68 @@
+from db.init_db import split_statements
+
+
+def test_splits_on_semicolons():
+    script = "CREATE TABLE a (x NUMBER);\nCREATE SEQUENCE a_seq START WITH 1;\n"
+    assert list(split_statements(script)) == [
+        "CREATE TABLE a (x NUMBER)",
+        "CREATE SEQUENCE a_seq START WITH 1",
+    ]
+
+
+def test_plsql_block_ends_at_slash_line():
+    script = (
+        "CREATE OR REPLACE TRIGGER t\n"
+        "BEFORE INSERT ON a FOR EACH ROW\n"
+        "BEGIN\n"
+        "    SELECT a_seq.NEXTVAL INTO :NEW.ID FROM DUAL;\n"
+        "END;\n"
+        "/\n"
+        "CREATE TABLE b (y NUMBER);\n"
+    )
+    statements = list(split_statements(script))
+    assert len(statements) == 2
+    assert statements[0].startswith("CREATE OR REPLACE TRIGGER t")
+    assert statements[0].endswith("END;")
+    assert statements[1] == "CREATE TABLE b (y NUMBER)"
+
+
+def test_comments_are_dropped():
+    script = (
+        "-- header; not a statement\n"
+        "CREATE TABLE a (x NUMBER); -- trailing\n"
+        "/* block; comment */ CREATE TABLE b (y NUMBER);\n"
+    )
+    assert list(split_statements(script)) == [
+        "CREATE TABLE a (x NUMBER)",
+        "CREATE TABLE b (y NUMBER)",
+    ]
+
+
+def test_comment_markers_inside_line_comment_are_ignored():
+    script = (
+        "-- note /*\n"
+        "CREATE TABLE a (x NUMBER);\n"
+        "-- */\n"
+        "CREATE TABLE b (y NUMBER);\n"
+    )
+    assert list(split_statements(script)) == [
+        "CREATE TABLE a (x NUMBER)",
+        "CREATE TABLE b (y NUMBER)",
+    ]
+
+
+def test_markers_inside_string_literals_are_kept():
+    script = (
+        "INSERT INTO t VALUES ('a--b');\n"
+        "INSERT INTO t VALUES ('c;d /* e */');\n"
+        "INSERT INTO t VALUES ('it''s');\n"
+    )
+    assert list(split_statements(script)) == [
+        "INSERT INTO t VALUES ('a--b')",
+        "INSERT INTO t VALUES ('c;d /* e */')",
+        "INSERT INTO t VALUES ('it''s')",
+    ]
+
+
+def test_blank_and_comment_only_script():
+    assert list(split_statements("\n  -- nothing here\n/* or here */\n;")) == []
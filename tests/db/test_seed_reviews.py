@@ -0,0 +1,130 @@
+import csv
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from db.seed_reviews import (
+    REVIEW_INPUT_SIZES,
+    STAGE_REVIEW_SQL,
+    format_json_field,
+    iter_review_batches,
+    stage_review_batch,
+)
+
+CSV_HEADER = [
+    "review_text",
+    "rating",
+    "date",
+    "bank",
+    "source",
+    "cleaned_text",
+    "sentiment_label",
+    "sentiment_score",
+    "keywords",
+    "themes",
+]
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("['login', 'slow app']", '["login","slow app"]'),
+        ('["Reliability", "User Experience"]', '["Reliability","User Experience"]'),
+        ('["true", null]', '["true",null]'),
+        ("[]", "[]"),
+    ],
+)
+def test_format_json_field_lists(raw, expected):
+    assert format_json_field(raw) == expected
+
+
+@pytest.mark.parametrize(
+    "raw", ["not a list", "{'a', 'b'}", "('a', 'b')", "1+2j", "{'a': 1}"]
+)
+def test_format_json_field_rejects_non_lists(raw):
+    assert format_json_field(raw) == "[]"
+
+
+def write_reviews_csv(path, n_rows):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        for i in range(n_rows):
+            writer.writerow(
+                [
+                    f"Review {i}, with a comma",
+                    "4",
+                    "2024-01-0" + str(i + 1),
+                    "CBE",
+                    "Google Play",
+                    f"review {i}",
+                    "positive",
+                    "0.98",
+                    "['login', 'slow']",
+                    '["Reliability"]',
+                ]
+            )
+
+
+def test_iter_review_batches_streams_typed_rows(tmp_path):
+    path = tmp_path / "reviews.csv"
+    write_reviews_csv(path, 5)
+
+    batches = list(iter_review_batches(str(path), batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert batches[0][0] == (
+        "Review 0, with a comma",
+        4.0,
+        date(2024, 1, 1),
+        "CBE",
+        "Google Play",
+        "review 0",
+        "positive",
+        0.98,
+        '["login","slow"]',
+        '["Reliability"]',
+    )
+
+
+def test_iter_review_batches_empty_file(tmp_path):
+    path = tmp_path / "reviews.csv"
+    path.write_text("")
+    assert list(iter_review_batches(str(path))) == []
+
+
+class FakeCursor:
+    """Records the calls stage_review_batch makes on an oracledb cursor."""
+
+    def __init__(self, failed_offsets=()):
+        self.failed_offsets = failed_offsets
+        self.input_sizes = None
+        self.executed = None
+
+    def setinputsizes(self, *sizes):
+        self.input_sizes = sizes
+
+    def executemany(self, sql, rows, batcherrors=False):
+        self.executed = (sql, rows, batcherrors)
+
+    def getbatcherrors(self):
+        return [
+            SimpleNamespace(offset=offset, message="ORA-12899: value too large")
+            for offset in self.failed_offsets
+        ]
+
+
+def test_stage_review_batch_binds_every_column(tmp_path):
+    path = tmp_path / "reviews.csv"
+    write_reviews_csv(path, 3)
+    (batch,) = iter_review_batches(str(path))
+    cursor = FakeCursor(failed_offsets=[1])
+
+    staged = stage_review_batch(cursor, batch)
+
+    assert staged == 2
+    assert cursor.input_sizes == REVIEW_INPUT_SIZES
+    assert cursor.executed == (STAGE_REVIEW_SQL, batch, True)
+    # One bind placeholder and one input size per tuple field
+    assert STAGE_REVIEW_SQL.count(":") == len(REVIEW_INPUT_SIZES) == len(batch[0])
@@ -1,5 +1,6 @@
 # import pytest
-from features.keyword_extraction import extract_keywords
+from features.keyword_extraction import extract_keywords, extract_keywords_and_themes
+from features.theme_clustering import assign_themes
 
 
 class TestExtractKeywords:
@@ -62,3 +63,16 @@ class TestExtractKeywords:
         assert isinstance(result, list)
         assert len(result) == 2
         assert all(isinstance(kw, list) for kw in result)
+
+    def test_extract_keywords_and_themes_matches_separate_calls(self):
+        """The fused pass gives the same keywords and themes as the two-step path."""
+        texts = [
+            "login failed and the app keeps crashing",
+            "",
+            "transfer was slow but customer support helped",
+            "great ui",
+        ]
+        keywords, themes = extract_keywords_and_themes(texts, top_k=3)
+
+        assert keywords == extract_keywords(texts, top_k=3)
+        assert themes == [assign_themes(kws) for kws in keywords]
@@ -1,5 +1,5 @@
 import pytest
-from features.theme_clustering import assign_themes
+from features.theme_clustering import assign_themes, theme_bitmask, themes_from_bitmask
 
 
 class TestAssignThemes:
@@ -45,3 +45,12 @@ class TestAssignThemes:
         result = assign_themes(["app crashing", "login failed"])
         assert "Reliability" in result
         assert "Account Access Issues" in result
+
+    def test_theme_bitmask_round_trip(self):
+        """Decoding OR-ed bitmasks gives the same themes as assign_themes."""
+        keywords = ["slow login", "crash", "foo"]
+        mask = 0
+        for keyword in keywords:
+            mask |= theme_bitmask(keyword)
+        assert themes_from_bitmask(mask) == assign_themes(keywords)
+        assert themes_from_bitmask(theme_bitmask("foo")) == ["Miscellaneous"]
@@ -0,0 +1,9 @@
+import pytest
+
+from models.sentiment_model import get_sentiment_pipeline
+
+
+@pytest.fixture(scope="session", autouse=True)
+def sentiment_pipeline():
+    """Load the sentiment model once per test session (or xdist worker)."""
+    return get_sentiment_pipeline()
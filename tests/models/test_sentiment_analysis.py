@@ -1,7 +1,7 @@
 # tests/features/test_sentiment_analysis.py
 
 import pytest
-from models.sentiment_model import analyze_sentiment
+from models.sentiment_model import analyze_sentiment, analyze_sentiment_batch
 
 
 class TestAnalyzeSentiment:
@@ -38,3 +38,25 @@ class TestAnalyzeSentiment:
         label, score = analyze_sentiment(long_text)
         assert label in ["positive", "negative"]
         assert isinstance(score, float)
+
+    def test_list_input_is_scored_in_one_call(self):
+        texts = [
+            "I love using this fintech app. It's amazing!",
+            "The app keeps crashing. It's so frustrating!",
+        ]
+        results = analyze_sentiment(texts)
+        assert [label for label, _ in results] == ["positive", "negative"]
+        assert results[0] == analyze_sentiment(texts[0])
+
+    def test_list_input_with_invalid_entry(self):
+        with pytest.raises(ValueError):
+            analyze_sentiment(["Great app", ""])
+
+    def test_batch_matches_single_and_handles_invalid(self):
+        texts = ["I love using this fintech app. It's amazing!", "", None]
+        results = analyze_sentiment_batch(texts + texts[:1])
+        assert len(results) == 4
+        assert results[3] == results[0]
+        assert results[0][0] == analyze_sentiment(texts[0])[0]
+        assert results[1] == ("neutral", 0.0)
+        assert results[2] == ("neutral", 0.0)
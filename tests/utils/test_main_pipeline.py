@@ -51,3 +51,20 @@ def test_run_pipeline_end_to_end():
         # Check if sentiment and theme are non-null
         assert result_df["sentiment_label"].notnull().all()
         assert result_df["themes"].notnull().all()
+
+
+def test_run_pipeline_header_only_input():
+    """An input with no reviews still produces an output with every column."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_path = Path(temp_dir) / "empty_input.csv"
+        output_path = Path(temp_dir) / "empty_output.csv"
+        pd.DataFrame({"review": []}).to_csv(input_path, index=False)
+
+        run_pipeline(str(input_path), str(output_path))
+
+        result_df = pd.read_csv(output_path)
+        assert result_df.empty
+        assert {"cleaned_text", "sentiment_label", "keywords", "themes"}.issubset(
+            result_df.columns
+        )
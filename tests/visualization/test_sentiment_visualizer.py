@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from visualization.sentiment_visualizer import (
+    load_reviews,
+    parse_list_column,
+    render_wordcloud,
+)
+
+
+def test_parse_list_column_json_and_python_literals():
+    values = pd.Series(
+        ['["Reliability", "User Experience"]', "['login', 'slow app']", np.nan]
+    )
+    assert parse_list_column(values) == [
+        ["Reliability", "User Experience"],
+        ["login", "slow app"],
+        [],
+    ]
+
+
+def test_parse_list_column_does_not_execute_code():
+    with pytest.raises(ValueError):
+        parse_list_column(pd.Series(["__import__('os').getcwd()"]))
+
+
+def test_load_reviews_reuses_parquet_cache(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(
+        "visualization.sentiment_visualizer.REVIEWS_CACHE_DIR", cache_dir
+    )
+    csv_path = tmp_path / "reviews.csv"
+    pd.DataFrame(
+        {
+            "date": ["2024-01-02", "bad"],
+            "themes": ['["Reliability"]', "['Customer Support', 'Reliability']"],
+            "keywords": ['["crash"]', "['slow', 'support']"],
+        }
+    ).to_csv(csv_path, index=False)
+
+    first = load_reviews(str(csv_path))
+    assert len(list(cache_dir.glob("reviews.csv-*.parquet"))) == 1
+    second = load_reviews(str(csv_path))
+
+    pd.testing.assert_frame_equal(first, second)
+    assert second["themes"].tolist() == [
+        ["Reliability"],
+        ["Customer Support", "Reliability"],
+    ]
+    assert pd.api.types.is_datetime64_any_dtype(second["date"])
+
+
+def test_load_reviews_skips_cache_arrow_cannot_store(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(
+        "visualization.sentiment_visualizer.REVIEWS_CACHE_DIR", cache_dir
+    )
+    csv_path = tmp_path / "reviews.csv"
+    pd.DataFrame(
+        {
+            "date": ["2024-01-02"],
+            "themes": ['["Reliability"]'],
+            "keywords": ['["crash"]'],
+        }
+    ).to_csv(csv_path, index=False)
+
+    def load_mixed(filepath):
+        df = pd.DataFrame({"app_id": [1, "cbe"], "date": pd.NaT})
+        df["themes"] = [[], []]
+        df["keywords"] = [[], []]
+        return df
+
+    monkeypatch.setattr(
+        "visualization.sentiment_visualizer._load_reviews_csv", load_mixed
+    )
+    df = load_reviews(str(csv_path))
+
+    assert df["app_id"].tolist() == [1, "cbe"]
+    assert not list(cache_dir.glob("*.parquet"))
+
+
+def test_render_wordcloud_reuses_disk_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "visualization.sentiment_visualizer.WORDCLOUD_CACHE_DIR", tmp_path
+    )
+    frequencies = {"fast transfer": 3, "login": 1}
+
+    first = render_wordcloud(frequencies, width=200, height=100)
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+    second = render_wordcloud(dict(reversed(frequencies.items())), 200, 100)
+
+    assert first.shape == (100, 200, 3)
+    np.testing.assert_array_equal(first, second)
@@ -0,0 +1,23 @@
+import pandas as pd
+
+from visualization.visualizer import ReviewVisualizer, _cloud_words
+
+
+def test_cloud_words_filter_like_wordcloud():
+    words = _cloud_words("the app's login took 2 minutes, 5 times. it's slow")
+    assert words == ["app", "login", "took", "minutes", "times", "slow"]
+
+
+def test_non_numeric_ratings_become_missing(tmp_path):
+    df = pd.DataFrame(
+        {
+            "userName": ["a", "b", "c"],
+            "review": ["Great", "Slow", "Fine"],
+            "rating": [5, "n/a", 3],
+            "thumbsUpCount": [0, 1, 2],
+            "date": ["2024-01-01", "2024-01-02", "2024-01-03"],
+            "bank": ["CBE", "BOA", "CBE"],
+        }
+    )
+    visualizer = ReviewVisualizer(df, output_dir=str(tmp_path))
+    assert visualizer.df["rating"].isna().tolist() == [False, True, False]